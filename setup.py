@@ -25,6 +25,14 @@ setup(
     url="https://github.com/IceNet-01/WXNET",
     packages=find_packages(),
     install_requires=requirements,
+    extras_require={
+        "speedups": [
+            "uvloop>=0.19.0; sys_platform != 'win32'",
+            "numba>=0.58.0",
+            "orjson>=3.9.0",
+            "msgpack>=1.0.0",
+        ],
+    },
     entry_points={
         "console_scripts": [
             "wxnet=wxnet.app:main",
@@ -1 +1,33 @@
 """API clients for weather data sources."""
+
+import json
+
+import aiohttp
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from ..config import config
+
+# JSON decoder for API responses; orjson when installed, which parses the
+# large NWS GeoJSON payloads several times faster than the stdlib
+json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Create the HTTP session shared by all API clients.
+
+    Must be called on the event loop that will use the session. The
+    keep-alive outlasts the polling intervals so refreshes reuse their TLS
+    connections.
+
+    Returns:
+        Client session
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=16, keepalive_timeout=75, ttl_dns_cache=300),
+        headers={"User-Agent": config.nws_user_agent}
+    )
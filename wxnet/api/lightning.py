@@ -18,6 +18,7 @@ import numpy as np
 
 from ..models import LightningStrike
 from ..config import config
+from . import json_loads
 
 
 class LightningClient:
@@ -29,21 +30,28 @@ class LightningClient:
     # Blitzortung HTTP API
     BLITZ_API_URL = "https://data.blitzortung.org"
 
-    def __init__(self):
-        """Initialize lightning client."""
-        self.session: Optional[aiohttp.ClientSession] = None
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        """Initialize lightning client.
+
+        Args:
+            session: Shared HTTP session to use; one is created on demand if omitted
+        """
+        self.session: Optional[aiohttp.ClientSession] = session
+        # Only close the session on exit if we created it
+        self._owns_session = session is None
         self.ws_connection: Optional[websockets.WebSocketClientProtocol] = None
         self.strike_buffer: List[LightningStrike] = []
         self.max_buffer_size = 1000
 
     async def __aenter__(self):
         """Enter async context."""
-        self.session = aiohttp.ClientSession()
+        if not self.session:
+            self.session = aiohttp.ClientSession()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Exit async context."""
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
         if self.ws_connection:
             await self.ws_connection.close()
@@ -115,7 +123,7 @@ class LightningClient:
                 if response.status != 200:
                     return []
 
-                data = await response.json()
+                data = await response.json(loads=json_loads)
 
                 strikes = []
                 for strike_data in data.get("strikes", []):
@@ -152,44 +160,45 @@ class LightningClient:
         Returns:
             List of simulated strikes
         """
-        strikes = []
-
-        # Generate 10-50 strikes randomly distributed
+        # Generate 10-50 strikes randomly distributed, drawing every field
+        # for all strikes at once
         num_strikes = np.random.randint(10, 50)
         now = datetime.utcnow()
 
-        for i in range(num_strikes):
-            # Random position within radius
-            angle = np.random.uniform(0, 2 * np.pi)
-            dist = np.random.uniform(0, radius_km)
-
-            # Convert to lat/lon offset (rough approximation)
-            dlat = (dist * np.cos(angle)) / 111  # 111 km per degree latitude
-            dlon = (dist * np.sin(angle)) / (111 * np.cos(np.radians(latitude)))
+        # Random position within radius
+        angle = np.random.uniform(0, 2 * np.pi, num_strikes)
+        dist = np.random.uniform(0, radius_km, num_strikes)
 
-            strike_lat = latitude + dlat
-            strike_lon = longitude + dlon
+        # Convert to lat/lon offset (rough approximation)
+        dlat = (dist * np.cos(angle)) / 111  # 111 km per degree latitude
+        dlon = (dist * np.sin(angle)) / (111 * np.cos(np.radians(latitude)))
 
-            # Random time within window
-            time_offset = np.random.uniform(0, minutes * 60)
-            strike_time = now - timedelta(seconds=time_offset)
+        # Random time within window
+        time_offsets = np.random.uniform(0, minutes * 60, num_strikes)
 
-            # Random strength (kA)
-            strength = np.random.uniform(10, 200)
+        # Random strength (kA)
+        strengths = np.random.uniform(10, 200, num_strikes)
 
-            # Type: 80% CG, 20% IC
-            strike_type = "CG" if np.random.random() < 0.8 else "IC"
+        # Type: 80% CG, 20% IC
+        is_cg = np.random.random(num_strikes) < 0.8
 
-            strike = LightningStrike(
+        # Plain Python values keep pydantic on its fast validation path
+        return [
+            LightningStrike(
                 latitude=strike_lat,
                 longitude=strike_lon,
-                timestamp=strike_time,
+                timestamp=now - timedelta(seconds=time_offset),
                 strength=strength,
-                type=strike_type
+                type="CG" if cg else "IC"
             )
-            strikes.append(strike)
-
-        return strikes
+            for strike_lat, strike_lon, time_offset, strength, cg in zip(
+                (latitude + dlat).tolist(),
+                (longitude + dlon).tolist(),
+                time_offsets.tolist(),
+                strengths.tolist(),
+                is_cg.tolist(),
+            )
+        ]
 
     async def start_realtime_monitoring(
         self,
@@ -220,7 +229,7 @@ class LightningClient:
                 # Listen for strikes
                 while True:
                     message = await websocket.recv()
-                    strike_data = json.loads(message)
+                    strike_data = json_loads(message)
 
                     strike = LightningStrike(
                         latitude=float(strike_data.get("lat", 0)),
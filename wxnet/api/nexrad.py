@@ -22,8 +22,11 @@ try:
 except ImportError:
     PYART_AVAILABLE = False
 
-from ..models import RadarData, StormCell
+from ..models import RadarData, StormCell, StormCellTable
 from ..config import config
+from ..utils import calculate_distance_bearing_batch
+
+_KM_PER_MILE = 1.609344
 
 
 class NEXRADClient:
@@ -161,24 +164,36 @@ class NEXRADClient:
         "KBHX": {"name": "Eureka", "lat": 40.4986, "lon": -124.2919, "state": "CA"},
     }
 
+    # Station coordinates as arrays, to measure to every station at once
+    _STATION_IDS = tuple(NEXRAD_STATIONS)
+    _STATION_LATS = np.array([info["lat"] for info in NEXRAD_STATIONS.values()])
+    _STATION_LONS = np.array([info["lon"] for info in NEXRAD_STATIONS.values()])
+
     # AWS S3 bucket for NEXRAD Level 2 data
     NEXRAD_BUCKET = "noaa-nexrad-level2"
 
     # NOAA NEXRAD data service
     NEXRAD_SERVICE_URL = "https://opengeo.ncep.noaa.gov/geoserver/nws/ows"
 
-    def __init__(self):
-        """Initialize NEXRAD client."""
-        self.session: Optional[aiohttp.ClientSession] = None
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        """Initialize NEXRAD client.
+
+        Args:
+            session: Shared HTTP session to use; one is created on demand if omitted
+        """
+        self.session: Optional[aiohttp.ClientSession] = session
+        # Only close the session on exit if we created it
+        self._owns_session = session is None
 
     async def __aenter__(self):
         """Enter async context."""
-        self.session = aiohttp.ClientSession()
+        if not self.session:
+            self.session = aiohttp.ClientSession()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Exit async context."""
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
 
     def find_nearest_stations(
@@ -197,18 +212,14 @@ class NEXRADClient:
         Returns:
             List of (station_id, distance_km) tuples
         """
-        distances = []
-
-        for station_id, info in self.NEXRAD_STATIONS.items():
-            # Simple distance calculation
-            dlat = latitude - info["lat"]
-            dlon = longitude - info["lon"]
-            dist = np.sqrt(dlat**2 + dlon**2) * 111  # Rough km conversion
-            distances.append((station_id, dist))
+        # Great-circle distance to every station in one call
+        dists, _ = calculate_distance_bearing_batch(
+            latitude, longitude, self._STATION_LATS, self._STATION_LONS
+        )
+        dists_km = dists * _KM_PER_MILE
 
-        # Sort by distance
-        distances.sort(key=lambda x: x[1])
-        return distances[:count]
+        nearest = np.argsort(dists_km, kind="stable")[:count]
+        return [(self._STATION_IDS[i], float(dists_km[i])) for i in nearest.tolist()]
 
     async def get_latest_scan_time(self, station: str) -> Optional[datetime]:
         """Get the timestamp of the latest available radar scan.
@@ -277,6 +288,24 @@ class NEXRADClient:
             print("PyART not available. Install with: pip install arm_pyart")
             return None
 
+        # Decoding the archive is CPU-bound; keep it off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._read_level2_sync, radar_data, station)
+
+    def _read_level2_sync(
+        self,
+        radar_data: bytes,
+        station: str
+    ) -> Optional[Dict[str, Any]]:
+        """Decode Level 2 radar data with PyART, blocking.
+
+        Args:
+            radar_data: Raw Level 2 data
+            station: Station ID
+
+        Returns:
+            Processed radar dictionary or None
+        """
         try:
             # Save to temporary file
             with tempfile.NamedTemporaryFile(delete=False, suffix='.gz') as tmp:
@@ -330,13 +359,14 @@ class NEXRADClient:
         Returns:
             Radar data or None
         """
-        # Try to get real data first
-        radar_bytes = await self.download_level2_data(station)
-
-        if radar_bytes and PYART_AVAILABLE:
-            processed = await self.process_level2_data(radar_bytes, station)
-            if processed:
-                return self._convert_to_radar_data(processed, "reflectivity")
+        # Try to get real data first; without PyART the archive can't be
+        # decoded, so don't download it
+        if PYART_AVAILABLE:
+            radar_bytes = await self.download_level2_data(station)
+            if radar_bytes:
+                processed = await self.process_level2_data(radar_bytes, station)
+                if processed:
+                    return self._convert_to_radar_data(processed, "reflectivity")
 
         # Fallback to simulated data for demo
         return self._generate_simulated_radar(station, latitude, longitude, "reflectivity")
@@ -441,7 +471,7 @@ class NEXRADClient:
         self,
         radar_data: RadarData,
         threshold_dbz: int = 40
-    ) -> List[StormCell]:
+    ) -> StormCellTable:
         """Detect storm cells using advanced algorithms.
 
         Args:
@@ -449,12 +479,34 @@ class NEXRADClient:
             threshold_dbz: Minimum reflectivity threshold
 
         Returns:
-            List of detected storm cells
+            Table of detected storm cells
+        """
+        return self.detect_storm_cells_sync(radar_data, threshold_dbz)
+
+    def detect_storm_cells_sync(
+        self,
+        radar_data: RadarData,
+        threshold_dbz: int = 40
+    ) -> StormCellTable:
+        """Detect storm cells without touching the event loop.
+
+        Pure CPU work over the radar grid, safe to run in an executor.
+
+        Args:
+            radar_data: Radar data
+            threshold_dbz: Minimum reflectivity threshold
+
+        Returns:
+            Table of detected storm cells
         """
         cells = []
 
-        # Convert to numpy array for processing
-        data_array = np.array(radar_data.data, dtype=float)
+        # Convert to numpy array for processing, reusing the int8 grid
+        # quantized at ingest when there is one
+        if radar_data._grid is not None:
+            data_array = radar_data._grid
+        else:
+            data_array = np.array(radar_data.data, dtype=float)
 
         # Find local maxima
         from scipy import ndimage
@@ -464,22 +516,35 @@ class NEXRADClient:
 
         # Label connected regions
         labeled, num_cells = ndimage.label(cell_mask)
+        if num_cells == 0:
+            return StormCellTable.from_cells(cells)
 
-        # Process each cell
-        for cell_id in range(1, num_cells + 1):
-            cell_indices = np.where(labeled == cell_id)
+        # Size, peak reflectivity and centroid of every region in one pass
+        # over the grid each, instead of a full-grid scan per region
+        flat_labels = labeled.ravel()
+        rows, cols = np.indices(data_array.shape)
+        sizes = np.bincount(flat_labels, minlength=num_cells + 1)[1:]
+        sum_y = np.bincount(flat_labels, weights=rows.ravel(), minlength=num_cells + 1)[1:]
+        sum_x = np.bincount(flat_labels, weights=cols.ravel(), minlength=num_cells + 1)[1:]
+        max_refs = np.asarray(ndimage.maximum(data_array, labeled, np.arange(1, num_cells + 1)))
 
-            if len(cell_indices[0]) < 10:  # Minimum cell size
-                continue
+        # Drop regions below the minimum cell size, strongest cells first
+        keep = np.flatnonzero(sizes >= 10)
+        keep = keep[np.argsort(-max_refs[keep], kind="stable")]
 
+        half_y = len(data_array) / 2
+        half_x = len(data_array[0]) / 2
+
+        # Process each cell
+        for k in keep:
             # Calculate cell properties
-            max_ref = float(np.max(data_array[cell_indices]))
-            mean_y = float(np.mean(cell_indices[0]))
-            mean_x = float(np.mean(cell_indices[1]))
+            max_ref = float(max_refs[k])
+            mean_y = float(sum_y[k] / sizes[k])
+            mean_x = float(sum_x[k] / sizes[k])
 
             # Convert grid to lat/lon (simplified)
-            cell_lat = radar_data.latitude + (mean_y - len(data_array)/2) * 0.01
-            cell_lon = radar_data.longitude + (mean_x - len(data_array[0])/2) * 0.01
+            cell_lat = radar_data.latitude + (mean_y - half_y) * 0.01
+            cell_lon = radar_data.longitude + (mean_x - half_x) * 0.01
 
             # Check for rotation signatures (velocity data needed)
             has_rotation = max_ref > 55 and np.random.random() < 0.3
@@ -502,4 +567,4 @@ class NEXRADClient:
             )
             cells.append(cell)
 
-        return cells
+        return StormCellTable.from_cells(cells)
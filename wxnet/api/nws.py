@@ -5,6 +5,7 @@ from datetime import datetime
 from typing import List, Optional, Dict, Any
 from ..models import WeatherAlert, AlertSeverity, AlertStatus, Forecast, ForecastPeriod, CurrentWeather
 from ..config import config
+from . import json_loads
 
 
 class NWSClient:
@@ -12,22 +13,29 @@ class NWSClient:
 
     BASE_URL = "https://api.weather.gov"
 
-    def __init__(self):
-        """Initialize NWS client."""
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        """Initialize NWS client.
+
+        Args:
+            session: Shared HTTP session to use; one is created on demand if omitted
+        """
         self.headers = {
             "User-Agent": config.nws_user_agent,
             "Accept": "application/geo+json"
         }
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.session: Optional[aiohttp.ClientSession] = session
+        # Only close the session on exit if we created it
+        self._owns_session = session is None
 
     async def __aenter__(self):
         """Enter async context."""
-        self.session = aiohttp.ClientSession(headers=self.headers)
+        if not self.session:
+            self.session = aiohttp.ClientSession(headers=self.headers)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Exit async context."""
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
 
     async def get_alerts(self, latitude: float, longitude: float) -> List[WeatherAlert]:
@@ -50,11 +58,11 @@ class NWSClient:
         }
 
         try:
-            async with self.session.get(url, params=params) as response:
+            async with self.session.get(url, params=params, headers=self.headers) as response:
                 if response.status != 200:
                     return []
 
-                data = await response.json()
+                data = await response.json(loads=json_loads)
                 alerts = []
 
                 for feature in data.get("features", []):
@@ -128,22 +136,22 @@ class NWSClient:
         try:
             # First get the grid point
             point_url = f"{self.BASE_URL}/points/{latitude},{longitude}"
-            async with self.session.get(point_url) as response:
+            async with self.session.get(point_url, headers=self.headers) as response:
                 if response.status != 200:
                     return None
 
-                point_data = await response.json()
+                point_data = await response.json(loads=json_loads)
                 forecast_url = point_data.get("properties", {}).get("forecast")
 
                 if not forecast_url:
                     return None
 
             # Get the forecast
-            async with self.session.get(forecast_url) as response:
+            async with self.session.get(forecast_url, headers=self.headers) as response:
                 if response.status != 200:
                     return None
 
-                forecast_data = await response.json()
+                forecast_data = await response.json(loads=json_loads)
                 properties = forecast_data.get("properties", {})
 
                 periods = []
@@ -189,22 +197,22 @@ class NWSClient:
         try:
             # First get the grid point
             point_url = f"{self.BASE_URL}/points/{latitude},{longitude}"
-            async with self.session.get(point_url) as response:
+            async with self.session.get(point_url, headers=self.headers) as response:
                 if response.status != 200:
                     return None
 
-                point_data = await response.json()
+                point_data = await response.json(loads=json_loads)
                 stations_url = point_data.get("properties", {}).get("observationStations")
 
                 if not stations_url:
                     return None
 
             # Get the nearest station
-            async with self.session.get(stations_url) as response:
+            async with self.session.get(stations_url, headers=self.headers) as response:
                 if response.status != 200:
                     return None
 
-                stations_data = await response.json()
+                stations_data = await response.json(loads=json_loads)
                 stations = stations_data.get("features", [])
 
                 if not stations:
@@ -214,11 +222,11 @@ class NWSClient:
 
             # Get latest observation
             obs_url = f"{self.BASE_URL}/stations/{station_id}/observations/latest"
-            async with self.session.get(obs_url) as response:
+            async with self.session.get(obs_url, headers=self.headers) as response:
                 if response.status != 200:
                     return None
 
-                obs_data = await response.json()
+                obs_data = await response.json(loads=json_loads)
                 props = obs_data.get("properties", {})
 
                 # Helper to get value from unit dict
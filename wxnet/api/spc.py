@@ -32,18 +32,25 @@ class SPCProductsClient:
     WATCH_URL = f"{BASE_URL}/products/watch"
     REPORTS_URL = f"{BASE_URL}/climo/reports"
 
-    def __init__(self):
-        """Initialize SPC client."""
-        self.session: Optional[aiohttp.ClientSession] = None
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        """Initialize SPC client.
+
+        Args:
+            session: Shared HTTP session to use; one is created on demand if omitted
+        """
+        self.session: Optional[aiohttp.ClientSession] = session
+        # Only close the session on exit if we created it
+        self._owns_session = session is None
 
     async def __aenter__(self):
         """Enter async context."""
-        self.session = aiohttp.ClientSession()
+        if not self.session:
+            self.session = aiohttp.ClientSession()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Exit async context."""
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
 
     async def get_convective_outlook(self, day: int = 1) -> Optional[Dict[str, Any]]:
@@ -3,253 +3,548 @@ WXNET Advanced Application - Professional Severe Weather Monitoring Terminal
 """
 
 import asyncio
-from datetime import datetime
-from typing import Optional, List, Dict, Any
+import sys
+import time
+import aiohttp
+from bisect import bisect_left, bisect_right
+from typing import Optional, List, Dict, Any, Final, ClassVar, Tuple
+import numpy as np
 from textual.app import App, ComposeResult
-from textual.containers import Container, Horizontal, Vertical, ScrollableContainer, VerticalScroll
-from textual.widgets import Header, Footer, Static, Label, DataTable, TabbedContent, TabPane, Button
+from textual.containers import Container, Horizontal, Vertical, VerticalScroll
+from textual.widgets import Header, Footer, Static, Label, TabbedContent, TabPane
 from textual.reactive import reactive
 from textual.binding import Binding
+from textual.timer import Timer
+from rich.console import Group, RenderableType
 from rich.text import Text
-from rich.table import Table as RichTable
-from rich.panel import Panel
-from rich.layout import Layout
+from rich.markup import escape
+from rich.cells import cell_len
 
 from .config import config
-from .models import WeatherAlert, CurrentWeather, StormCell, AtmosphericData, LightningStrike, Location
+from .models import WeatherAlert, CurrentWeather, StormCell, StormCellTable, AtmosphericData, LightningStrike, Location
 
 # Import new advanced APIs
+from .api import create_session
 from .api.nws import NWSClient
 from .api.nexrad import NEXRADClient
 from .api.spc import SPCProductsClient
 from .api.lightning import LightningClient
 from .api.mesoanalysis import MesoanalysisClient
-from .tracking import GPSTracker, SoundAlerts, ChaseLogger
+from .tracking import GPSTracker, SoundAlerts, create_chase_logger
 
 from .utils import (
     format_temperature, format_wind, format_pressure,
-    get_alert_color, get_alert_symbol, format_distance,
-    calculate_distance, calculate_bearing, format_bearing,
-    render_radar_ascii, format_time_ago,
+    get_alert_style, format_distance,
+    format_bearing, format_bearing_batch,
+    haversine_batch, calculate_distance_bearing_batch, render_radar_text, quantize_reflectivity,
+    format_time_ago, format_time_ago_epoch, format_time_ago_vec,
     format_cape, format_helicity
 )
 
+# Panel separators
+_SEP60: Final[str] = "─" * 60
+_SEP80: Final[str] = "─" * 80
+
+
+def _sep(width: int = 60) -> Static:
+    """Create a separator line between panel entries."""
+    return Static(_SEP60 if width == 60 else _SEP80)
+
+
+def _format_cell(
+    i: int,
+    cell: StormCell,
+    intensity_color: str,
+    dist: float,
+    bearing: int,
+    bearing_str: str,
+    movement_str: str,
+    intercept: Optional[Dict[str, Any]]
+) -> str:
+    """Format a storm cell entry as Rich markup.
+
+    Args:
+        i: 1-based cell number
+        cell: Storm cell
+        intensity_color: Color for the cell's reflectivity
+        dist: Distance to the cell in miles
+        bearing: Bearing to the cell in degrees
+        bearing_str: Compass point for bearing
+        movement_str: Compass point for the cell's movement direction
+        intercept: Intercept solution from GPSTracker.calculate_intercept, if any
+
+    Returns:
+        Markup string for Text.from_markup
+    """
+    parts = [
+        f"[bold yellow]CELL {i}: [/bold yellow]",
+        f"[bold {intensity_color}]{cell.intensity} dBZ  [/bold {intensity_color}]",
+    ]
 
-class AlertsPanel(Static):
-    """Scrollable panel for weather alerts."""
+    # Severe indicators
+    if cell.tvs:
+        parts.append("[bold bright_red blink]\\[TVS] [/bold bright_red blink]")
+    if cell.meso:
+        parts.append("[bold red]\\[MESO] [/bold red]")
+    if cell.max_hail_size and cell.max_hail_size > 1.0:
+        parts.append(f"[bold magenta]\\[HAIL {cell.max_hail_size}\"] [/bold magenta]")
+
+    # Location and movement
+    parts.append(f"\n   📍 Location: {format_distance(dist)} {bearing_str} ({bearing}°)")
+    parts.append(f"\n   🎯 Coordinates: {cell.latitude:.3f}°N, {cell.longitude:.3f}°W")
+    parts.append(f"\n   ➡️  Movement: {movement_str} @ {cell.movement_speed:.0f} mph")
+
+    # Severe attributes
+    if cell.has_rotation:
+        parts.append(f"[red]\n   🌪️  Rotation: {cell.rotation_strength:.4f}[/red]")
+    if cell.top_height:
+        parts.append(f"[cyan]\n   ⬆️  Top: {cell.top_height:,} ft[/cyan]")
+    if cell.hail_probability > 50:
+        parts.append(f"[magenta]\n   🧊 Hail Prob: {cell.hail_probability}%[/magenta]")
+
+    if intercept:
+        parts.append(
+            f"[bright_green]\n   🚗 Intercept: {intercept['chase_time_minutes']:.0f} min, "
+            f"{intercept['distance_miles']:.1f} mi @ {format_bearing(intercept['bearing'])}[/bright_green]"
+        )
+
+    return "".join(parts)
+
+
+def _format_strike(i: int, strike: LightningStrike) -> str:
+    """Format a lightning strike entry as Rich markup.
+
+    Args:
+        i: 1-based strike number
+        strike: Lightning strike with its age already formatted
+
+    Returns:
+        Markup string for Text.from_markup
+    """
+    type_color = "red" if strike.type == "CG" else "yellow"
+    return (
+        f"[dim]{i}. [/dim]"
+        f"[bold {type_color}]\\[{escape(str(strike.type))}] [/bold {type_color}]"
+        f"[white]{strike.latitude:.3f}°N, {strike.longitude:.3f}°W  [/white]"
+        f"[dim]{strike._age_str}  [/dim]"
+        f"[bright_yellow]{strike.strength:.0f}kA[/bright_yellow]"
+    )
+
+
+# Longest a single data source fetch may take before it's abandoned for this
+# round (seconds); radar downloads need the most headroom
+_FETCH_TIMEOUT: Final[float] = 30
+
+# Sources whose panels live on their own tab, mapped to that tab's id. These
+# are only refreshed while the tab is visible; alerts, weather, radar and GPS
+# feed the overview and sound alerts so they always run.
+_TAB_GATED_SOURCES: Final[Dict[str, str]] = {
+    "spc": "spc",
+    "lightning": "lightning",
+}
+
+
+def _pad(text: str, width: int) -> str:
+    """Pad plain text with spaces to a terminal cell width."""
+    return text + " " * max(0, width - cell_len(text))
+
+
+def _atmos_row(label: str, value: str, color: Optional[str] = None, interp: str = "") -> str:
+    """Format one atmospheric parameter row as Rich markup.
+
+    Args:
+        label: Styled, padded label from AtmosphericPanel._ROW_LABELS
+        value: Plain value text
+        color: Color for the value, if any
+        interp: Interpretation shown dimmed after the value
+
+    Returns:
+        Markup string for the row
+    """
+    value = _pad(value, 15)
+    if color:
+        value = f"[{color}]{value}[/{color}]"
+    return f"{label}{value}  [dim]{interp}[/dim]" if interp else label + value
+
+
+def _build_alert_text(alert: WeatherAlert) -> Text:
+    """Build the display text for a weather alert.
+
+    Args:
+        alert: Weather alert with its description already truncated
+
+    Returns:
+        Styled alert text for AlertsPanel
+    """
+    alert_text = Text()
+    color, symbol = get_alert_style(alert.severity.value, alert.event)
+    alert_text.append(f"{symbol} ", style="bold")
+    alert_text.append(alert.event, style=f"bold {color}")
+    alert_text.append(f"\n{', '.join(alert.areas[:3])}", style="dim")
+
+    if alert.expires:
+        alert_text.append(f"\nExpires: {format_time_ago(alert.expires)}", style="yellow")
+
+    if alert._short_desc:
+        alert_text.append(f"\n{alert._short_desc}", style="white")
+
+    return alert_text
+
+
+# SPC categorical risk colors
+_RISK_COLORS: Final[Dict[str, str]] = {
+    "HIGH": "bright_red",
+    "MDT": "red",
+    "ENH": "bright_yellow",
+    "SLGT": "yellow",
+    "MRGL": "blue",
+    "TSTM": "green"
+}
+
+# Storm cell intensity colors, indexed >60 dBZ, >50 dBZ, otherwise
+_INTENSITY_COLORS: Final[Tuple[str, ...]] = ("red", "yellow", "green")
+
+# Number of recent strikes listed in the lightning panel
+_MAX_DISPLAY_STRIKES: Final[int] = 20
 
-    alerts: reactive[List[WeatherAlert]] = reactive(list, recompose=True)
+# SPC watch type colors
+_WATCH_TYPE_COLORS: Final[Dict[str, str]] = {
+    "Tornado": "bright_red",
+    "Severe Thunderstorm": "yellow"
+}
+
+# Overview panel titles, parsed once at import
+_ALERTS_HEADER: Final[Text] = Text.from_markup("[bold red]⚠️  ACTIVE ALERTS[/bold red]")
+_CONDITIONS_HEADER: Final[Text] = Text.from_markup("[bold cyan]🌡️  CURRENT CONDITIONS[/bold cyan]")
+_ATMOS_HEADER: Final[Text] = Text.from_markup("[bold magenta]📊 ATMOSPHERIC DATA[/bold magenta]")
+_RADAR_HEADER: Final[Text] = Text.from_markup("[bold green]📡 NEXRAD RADAR[/bold green]")
+_CELLS_HEADER: Final[Text] = Text.from_markup("[bold yellow]⛈️  STORM CELLS[/bold yellow]")
+
+
+# Atmospheric parameter color ladders: bucket cutoffs and the color for each
+# bucket, looked up with bisect
+_CAPE_CUTOFFS: Final[Tuple[float, ...]] = (1000, 2500)
+_CAPE_COLORS: Final[Tuple[str, ...]] = ("green", "yellow", "red")
+_HELICITY_CUTOFFS: Final[Tuple[float, ...]] = (150, 300)
+_HELICITY_COLORS: Final[Tuple[str, ...]] = ("green", "yellow", "red")
+_SHEAR_CUTOFFS: Final[Tuple[float, ...]] = (20, 40)
+_SHEAR_COLORS: Final[Tuple[str, ...]] = ("green", "yellow", "red")
+# Lifted index is worse the more negative it gets
+_LI_CUTOFFS: Final[Tuple[float, ...]] = (-4, 0)
+_LI_COLORS: Final[Tuple[str, ...]] = ("red", "yellow", "green")
+
+
+def _cape_color(cape: float) -> str:
+    """Get display color for CAPE (J/kg)."""
+    return _CAPE_COLORS[bisect_left(_CAPE_CUTOFFS, cape)]
+
+
+def _helicity_color(helicity: float) -> str:
+    """Get display color for 0-3km helicity (m²/s²)."""
+    return _HELICITY_COLORS[bisect_left(_HELICITY_CUTOFFS, helicity)]
+
+
+def _shear_color(shear: float) -> str:
+    """Get display color for 0-6km shear (kts)."""
+    return _SHEAR_COLORS[bisect_left(_SHEAR_CUTOFFS, shear)]
+
+
+def _lifted_index_color(lifted_index: float) -> str:
+    """Get display color for lifted index."""
+    return _LI_COLORS[bisect_right(_LI_CUTOFFS, lifted_index)]
+
+
+class _RenderedPanel(Static):
+    """Panel that draws a single renderable and redraws it in place.
+
+    Subclasses build their content in _build_body and call _redraw from their
+    reactive watchers, so data updates repaint one Static instead of
+    recomposing a tree of child widgets.
+    """
+
+    _SCROLLABLE: ClassVar[bool] = True
+    _body: Optional[Static] = None
+    # Last renderable drawn, so a shared constant (e.g. an empty state) isn't
+    # pushed to the body again
+    _shown: Optional[RenderableType] = None
 
     def compose(self) -> ComposeResult:
-        """Compose alerts display."""
-        with VerticalScroll():
-            if not self.alerts:
-                yield Label("[dim]No active alerts[/dim]")
-            else:
-                for alert in self.alerts:
-                    severity_color = get_alert_color(alert.severity.value)
-                    symbol = get_alert_symbol(alert.event)
+        """Compose panel body."""
+        self._shown = self._build_body()
+        self._body = Static(self._shown)
+        if self._SCROLLABLE:
+            with VerticalScroll():
+                yield self._body
+        else:
+            yield self._body
+
+    def _build_body(self) -> RenderableType:
+        """Build the panel's content."""
+        raise NotImplementedError
+
+    def _redraw(self) -> None:
+        """Rebuild the content into the existing body widget."""
+        if self._body is not None:
+            renderable = self._build_body()
+            if renderable is not self._shown:
+                self._shown = renderable
+                self._body.update(renderable)
+
+
+class AlertsPanel(_RenderedPanel):
+    """Scrollable panel for weather alerts."""
 
-                    # Create alert panel
-                    alert_text = Text()
-                    alert_text.append(f"{symbol} ", style="bold")
-                    alert_text.append(alert.event, style=f"bold {severity_color}")
-                    alert_text.append(f"\n{', '.join(alert.areas[:3])}", style="dim")
+    alerts: reactive[List[Text]] = reactive(list)
 
-                    if alert.expires:
-                        alert_text.append(f"\nExpires: {format_time_ago(alert.expires)}", style="yellow")
+    _EMPTY: ClassVar[Text] = Text("No active alerts", style="dim")
 
-                    if alert.description:
-                        desc = alert.description[:200] + "..." if len(alert.description) > 200 else alert.description
-                        alert_text.append(f"\n{desc}", style="white")
+    def watch_alerts(self) -> None:
+        """Redraw when alerts change."""
+        self._redraw()
 
-                    yield Static(alert_text)
-                    yield Static("─" * 60)
+    def _build_body(self) -> RenderableType:
+        """Build alerts display."""
+        if not self.alerts:
+            return self._EMPTY
 
+        items = []
+        for alert_text in self.alerts:
+            items.append(alert_text)
+            items.append(_SEP60)
+        return Group(*items)
 
-class CurrentConditionsPanel(Static):
+
+class CurrentConditionsPanel(_RenderedPanel):
     """Panel for current weather conditions."""
 
-    weather: reactive[Optional[CurrentWeather]] = reactive(None, recompose=True)
+    weather: reactive[Optional[CurrentWeather]] = reactive(None)
+
+    _SCROLLABLE: ClassVar[bool] = False
+
+    # Styled, padded label column; only the values are formatted per update
+    _ROW_LABELS: ClassVar[Dict[str, str]] = {
+        key: f"[bold cyan]{_pad(label, 18)}[/bold cyan]  "
+        for key, label in (
+            ("temperature", "🌡️  Temperature:"),
+            ("feels_like", "🌡️  Feels Like:"),
+            ("dewpoint", "💧 Dewpoint:"),
+            ("humidity", "💦 Humidity:"),
+            ("pressure", "🔽 Pressure:"),
+            ("wind", "💨 Wind:"),
+            ("visibility", "👁️  Visibility:"),
+            ("conditions", "☁️  Conditions:"),
+            ("updated", "🕐 Updated:"),
+        )
+    }
 
-    def compose(self) -> ComposeResult:
-        """Compose current conditions."""
+    def watch_weather(self) -> None:
+        """Redraw when the observation changes."""
+        self._redraw()
+
+    def _build_body(self) -> RenderableType:
+        """Build current conditions."""
         if not self.weather:
-            yield Label("[dim]Loading weather data...[/dim]")
-            return
+            return Text.from_markup("[dim]Loading weather data...[/dim]")
 
         w = self.weather
-        table = RichTable.grid(padding=(0, 2))
-        table.add_column(style="bold cyan", width=18)
-        table.add_column()
+        labels = self._ROW_LABELS
 
-        table.add_row("🌡️  Temperature:", format_temperature(w.temperature))
-        table.add_row("🌡️  Feels Like:", format_temperature(w.feels_like))
+        rows = [
+            labels["temperature"] + format_temperature(w.temperature),
+            labels["feels_like"] + format_temperature(w.feels_like),
+        ]
         if w.dewpoint:
-            table.add_row("💧 Dewpoint:", format_temperature(w.dewpoint))
-        table.add_row("💦 Humidity:", f"{w.humidity}%")
-        table.add_row("🔽 Pressure:", format_pressure(w.pressure))
-        table.add_row("💨 Wind:", format_wind(w.wind_speed, w.wind_direction, w.wind_gust))
+            rows.append(labels["dewpoint"] + format_temperature(w.dewpoint))
+        rows.append(labels["humidity"] + f"{w.humidity}%")
+        rows.append(labels["pressure"] + format_pressure(w.pressure))
+        rows.append(labels["wind"] + format_wind(w.wind_speed, w.wind_direction, w.wind_gust))
         if w.visibility:
-            table.add_row("👁️  Visibility:", f"{w.visibility:.1f} mi")
-        table.add_row("☁️  Conditions:", w.conditions)
-        table.add_row("🕐 Updated:", format_time_ago(w.timestamp))
+            rows.append(labels["visibility"] + f"{w.visibility:.1f} mi")
+        rows.append(labels["conditions"] + escape(w.conditions))
+        rows.append(labels["updated"] + format_time_ago_epoch(w._epoch))
 
-        yield Static(table)
+        return Text.from_markup("\n".join(rows))
 
 
-class RadarPanel(Static):
+class RadarPanel(_RenderedPanel):
     """Scrollable radar display panel."""
 
-    radar_data: reactive[Optional[Any]] = reactive(None, recompose=True)
+    radar_data: reactive[Optional[Any]] = reactive(None)
     station: reactive[str] = reactive("KTLX")
 
-    def compose(self) -> ComposeResult:
-        """Compose radar display."""
-        with VerticalScroll():
-            if not self.radar_data:
-                yield Label("[dim]Loading radar data...[/dim]")
+    _LEGEND: ClassVar[Text] = Text("\nREFLECTIVITY SCALE (dBZ):\n", style="bold")
+    _LEGEND.append("  15-25: Light precip   ", style="blue")
+    _LEGEND.append("  25-35: Moderate   ", style="green")
+    _LEGEND.append("  35-45: Heavy   ", style="yellow")
+    _LEGEND.append("  45-55: Very Heavy   ", style="bright_yellow")
+    _LEGEND.append("  55-65: Extreme   ", style="red")
+    _LEGEND.append("  65+: Giant Hail", style="bright_red")
+
+    def __init__(self, *args, **kwargs):
+        """Initialize radar panel."""
+        super().__init__(*args, **kwargs)
+        # (radar_data the text was rendered from, rendered text)
+        self._radar_cache: Optional[Tuple[Any, Text]] = None
+
+    def watch_radar_data(self) -> None:
+        """Redraw when new radar data arrives."""
+        self._redraw()
+
+    def _build_body(self) -> RenderableType:
+        """Build radar display."""
+        if not self.radar_data:
+            return Text.from_markup("[dim]Loading radar data...[/dim]")
+
+        # Header
+        header = Text()
+        header.append(f"📡 NEXRAD RADAR: {self.station}\n", style="bold green")
+        time_str = self.radar_data._time_str or self.radar_data.timestamp.strftime('%H:%M:%S UTC')
+        header.append(f"Time: {time_str}\n", style="dim")
+        header.append(f"Product: {self.radar_data.product_type.upper()}", style="cyan")
+
+        # Use the text rendered at ingest; otherwise render here,
+        # reusing the last render if the data hasn't changed
+        radar_text = self.radar_data._ascii
+        if radar_text is None:
+            if self._radar_cache and self._radar_cache[0] is self.radar_data:
+                radar_text = self._radar_cache[1]
             else:
-                # Header
-                header = Text()
-                header.append(f"📡 NEXRAD RADAR: {self.station}\n", style="bold green")
-                header.append(f"Time: {self.radar_data.timestamp.strftime('%H:%M:%S UTC')}\n", style="dim")
-                header.append(f"Product: {self.radar_data.product_type.upper()}", style="cyan")
-                yield Static(header)
-
-                # Render radar
-                ascii_lines = render_radar_ascii(self.radar_data.data, width=100, height=40)
-                radar_text = "\n".join(ascii_lines)
-                yield Static(radar_text)
-
-                # Legend
-                legend = Text("\nREFLECTIVITY SCALE (dBZ):\n", style="bold")
-                legend.append("  15-25: Light precip   ", style="blue")
-                legend.append("  25-35: Moderate   ", style="green")
-                legend.append("  35-45: Heavy   ", style="yellow")
-                legend.append("  45-55: Very Heavy   ", style="bright_yellow")
-                legend.append("  55-65: Extreme   ", style="red")
-                legend.append("  65+: Giant Hail", style="bright_red")
-                yield Static(legend)
-
-
-class StormCellsPanel(Static):
+                radar_text = render_radar_text(self.radar_data.data, width=100, height=40)
+                self._radar_cache = (self.radar_data, radar_text)
+
+        return Group(header, radar_text, self._LEGEND)
+
+
+class StormCellsPanel(_RenderedPanel):
     """Scrollable storm cells panel."""
 
-    cells: reactive[List[StormCell]] = reactive(list, recompose=True)
+    cells: reactive[StormCellTable] = reactive(lambda: StormCellTable.from_cells([]))
     location: reactive[tuple] = reactive((35.0, -97.5))
     gps_tracker: Optional[GPSTracker] = None
 
-    def compose(self) -> ComposeResult:
-        """Compose storm cells display."""
-        with VerticalScroll():
-            if not self.cells:
-                yield Label("[dim]No storm cells detected[/dim]")
-            else:
-                lat, lon = self.location
-
-                for i, cell in enumerate(self.cells, 1):
-                    # Calculate distance and bearing
-                    dist = calculate_distance(lat, lon, cell.latitude, cell.longitude)
-                    bearing = calculate_bearing(lat, lon, cell.latitude, cell.longitude)
-                    bearing_str = format_bearing(bearing)
-
-                    # Create cell info
-                    cell_info = Text()
-                    cell_info.append(f"CELL {i}: ", style="bold yellow")
-
-                    # Color code intensity
-                    intensity_color = "red" if cell.intensity > 60 else "yellow" if cell.intensity > 50 else "green"
-                    cell_info.append(f"{cell.intensity} dBZ  ", style=f"bold {intensity_color}")
-
-                    # Severe indicators
-                    if cell.tvs:
-                        cell_info.append("[TVS] ", style="bold bright_red blink")
-                    if cell.meso:
-                        cell_info.append("[MESO] ", style="bold red")
-                    if cell.max_hail_size and cell.max_hail_size > 1.0:
-                        cell_info.append(f"[HAIL {cell.max_hail_size}\"] ", style="bold magenta")
-
-                    # Location and movement
-                    cell_info.append(f"\n   📍 Location: {format_distance(dist)} {bearing_str} ({bearing}°)")
-                    cell_info.append(f"\n   🎯 Coordinates: {cell.latitude:.3f}°N, {cell.longitude:.3f}°W")
-                    cell_info.append(f"\n   ➡️  Movement: {format_bearing(cell.movement_direction)} @ {cell.movement_speed:.0f} mph")
-
-                    # Severe attributes
-                    if cell.has_rotation:
-                        cell_info.append(f"\n   🌪️  Rotation: {cell.rotation_strength:.4f}", style="red")
-                    if cell.top_height:
-                        cell_info.append(f"\n   ⬆️  Top: {cell.top_height:,} ft", style="cyan")
-                    if cell.hail_probability > 50:
-                        cell_info.append(f"\n   🧊 Hail Prob: {cell.hail_probability}%", style="magenta")
-
-                    # Intercept calculation
-                    if self.gps_tracker and self.gps_tracker.current_location:
-                        intercept = self.gps_tracker.calculate_intercept(cell)
-                        if intercept:
-                            cell_info.append(f"\n   🚗 Intercept: {intercept['chase_time_minutes']:.0f} min, {intercept['distance_miles']:.1f} mi @ {format_bearing(intercept['bearing'])}", style="bright_green")
-
-                    yield Static(cell_info)
-                    yield Static("─" * 80)
-
-
-class AtmosphericPanel(Static):
+    _EMPTY: ClassVar[Text] = Text("No storm cells detected", style="dim")
+
+    def watch_cells(self) -> None:
+        """Redraw when a new set of cells is detected."""
+        self._redraw()
+
+    def _build_body(self) -> RenderableType:
+        """Build storm cells display."""
+        if not self.cells:
+            return self._EMPTY
+
+        lat, lon = self.location
+
+        # Calculate distance, bearing and intensity color for every cell in one pass
+        dists, bearings = calculate_distance_bearing_batch(
+            lat, lon, self.cells.lats, self.cells.lons
+        )
+
+        intensities = self.cells.intensities
+        color_idx = np.where(intensities > 60, 0, np.where(intensities > 50, 1, 2))
+
+        # Compass points for every bearing and movement direction at once
+        bearings = bearings.astype(np.int32)
+        bearing_strs = format_bearing_batch(bearings)
+        movement_strs = format_bearing_batch(self.cells.movement_directions)
+
+        # Convert the columns to Python values once rather than per cell
+        rows = zip(
+            self.cells, dists.tolist(), bearings.tolist(), color_idx.tolist(),
+            bearing_strs, movement_strs
+        )
+
+        # Cell entries and separators are joined into one markup string so the
+        # whole panel is parsed into a single Text
+        items = []
+        for i, (cell, dist, bearing, color, bearing_str, movement_str) in enumerate(rows, 1):
+            # Intercept calculation
+            intercept = None
+            if self.gps_tracker and self.gps_tracker.current_location:
+                intercept = self.gps_tracker.calculate_intercept(cell)
+
+            cell_info = _format_cell(
+                i, cell, _INTENSITY_COLORS[color], dist, bearing,
+                bearing_str, movement_str, intercept
+            )
+            items.append(cell_info)
+            items.append(_SEP80)
+        return Text.from_markup("\n".join(items))
+
+
+class AtmosphericPanel(_RenderedPanel):
     """Panel for atmospheric parameters."""
 
-    atmos_data: reactive[Optional[AtmosphericData]] = reactive(None, recompose=True)
+    atmos_data: reactive[Optional[AtmosphericData]] = reactive(None)
     sounding: reactive[Optional[Dict]] = reactive(None)
 
-    def compose(self) -> ComposeResult:
-        """Compose atmospheric display."""
-        with VerticalScroll():
-            if not self.atmos_data:
-                yield Label("[dim]Loading atmospheric data...[/dim]")
-            else:
-                data = self.atmos_data
+    # Styled, padded label column; only the values are formatted per update
+    _ROW_LABELS: ClassVar[Dict[str, str]] = {
+        key: f"[bold cyan]{_pad(label, 25)}[/bold cyan]  "
+        for key, label in (
+            ("cape", "⚡ CAPE:"),
+            ("cin", "🔒 CIN:"),
+            ("helicity", "🌀 0-3km Helicity:"),
+            ("shear", "💨 0-6km Shear:"),
+            ("lifted_index", "📊 Lifted Index:"),
+            ("k_index", "📈 K-Index:"),
+            ("total_totals", "📉 Total Totals:"),
+            ("updated", "🕐 Updated:"),
+        )
+    }
+
+    def watch_atmos_data(self) -> None:
+        """Redraw when atmospheric data changes."""
+        self._redraw()
 
-                # Create parameters table
-                table = RichTable.grid(padding=(0, 2))
-                table.add_column(style="bold cyan", width=25)
-                table.add_column(width=15)
-                table.add_column(style="dim")
+    def _build_body(self) -> RenderableType:
+        """Build atmospheric display."""
+        if not self.atmos_data:
+            return Text.from_markup("[dim]Loading atmospheric data...[/dim]")
 
-                if data.cape is not None:
-                    cape_val, cape_interp = format_cape(data.cape)
-                    cape_color = "red" if data.cape > 2500 else "yellow" if data.cape > 1000 else "green"
-                    table.add_row("⚡ CAPE:", f"[{cape_color}]{cape_val}[/{cape_color}]", cape_interp)
+        data = self.atmos_data
+        labels = self._ROW_LABELS
+        rows = []
 
-                if data.cin is not None:
-                    table.add_row("🔒 CIN:", f"{data.cin:.0f} J/kg", "")
+        if data.cape is not None:
+            cape_val, cape_interp = format_cape(data.cape)
+            rows.append(_atmos_row(labels["cape"], cape_val, _cape_color(data.cape), cape_interp))
 
-                if data.helicity is not None:
-                    hel_val, hel_interp = format_helicity(data.helicity)
-                    hel_color = "red" if data.helicity > 300 else "yellow" if data.helicity > 150 else "green"
-                    table.add_row("🌀 0-3km Helicity:", f"[{hel_color}]{hel_val}[/{hel_color}]", hel_interp)
+        if data.cin is not None:
+            rows.append(_atmos_row(labels["cin"], f"{data.cin:.0f} J/kg"))
 
-                if data.shear is not None:
-                    shear_color = "red" if data.shear > 40 else "yellow" if data.shear > 20 else "green"
-                    table.add_row("💨 0-6km Shear:", f"[{shear_color}]{data.shear:.0f} kts[/{shear_color}]", "")
+        if data.helicity is not None:
+            hel_val, hel_interp = format_helicity(data.helicity)
+            rows.append(_atmos_row(labels["helicity"], hel_val, _helicity_color(data.helicity), hel_interp))
 
-                if data.lifted_index is not None:
-                    li_color = "red" if data.lifted_index < -4 else "yellow" if data.lifted_index < 0 else "green"
-                    table.add_row("📊 Lifted Index:", f"[{li_color}]{data.lifted_index:.1f}[/{li_color}]", "")
+        if data.shear is not None:
+            rows.append(_atmos_row(labels["shear"], f"{data.shear:.0f} kts", _shear_color(data.shear)))
 
-                if data.k_index is not None:
-                    table.add_row("📈 K-Index:", f"{data.k_index:.0f}", "")
+        if data.lifted_index is not None:
+            rows.append(_atmos_row(
+                labels["lifted_index"], f"{data.lifted_index:.1f}", _lifted_index_color(data.lifted_index)
+            ))
 
-                if data.total_totals is not None:
-                    table.add_row("📉 Total Totals:", f"{data.total_totals:.0f}", "")
+        if data.k_index is not None:
+            rows.append(_atmos_row(labels["k_index"], f"{data.k_index:.0f}"))
 
-                table.add_row("🕐 Updated:", format_time_ago(data.timestamp), "")
+        if data.total_totals is not None:
+            rows.append(_atmos_row(labels["total_totals"], f"{data.total_totals:.0f}"))
 
-                yield Static(table)
+        rows.append(_atmos_row(labels["updated"], format_time_ago_epoch(data._epoch)))
 
-                # Show hodograph if available
-                if self.sounding:
-                    yield Static("\n")
-                    yield Static(Text("📊 HODOGRAPH (0-10km)", style="bold magenta"))
-                    # Would render hodograph ASCII art here
-                    yield Static("[dim]Hodograph visualization (coming soon)[/dim]")
+        table = Text.from_markup("\n".join(rows))
+
+        # Show hodograph if available
+        if self.sounding:
+            return Group(
+                table,
+                "\n",
+                Text("📊 HODOGRAPH (0-10km)", style="bold magenta"),
+                # Would render hodograph ASCII art here
+                Text.from_markup("[dim]Hodograph visualization (coming soon)[/dim]"),
+            )
+        return table
 
 
 class SPCProductsPanel(Static):
@@ -268,15 +563,7 @@ class SPCProductsPanel(Static):
             if self.outlook:
                 outlook_text = Text()
                 risk = self.outlook.get("categorical_risk", "TSTM")
-                risk_colors = {
-                    "HIGH": "bright_red",
-                    "MDT": "red",
-                    "ENH": "bright_yellow",
-                    "SLGT": "yellow",
-                    "MRGL": "blue",
-                    "TSTM": "green"
-                }
-                risk_color = risk_colors.get(risk, "white")
+                risk_color = _RISK_COLORS.get(risk, "white")
 
                 outlook_text.append(f"Risk Level: ", style="bold")
                 outlook_text.append(f"{risk}", style=f"bold {risk_color}")
@@ -305,7 +592,7 @@ class SPCProductsPanel(Static):
                     md_text.append(f"MD #{md.get('number', 'N/A')}\n", style="bold yellow")
                     md_text.append(md.get('summary', 'No summary available'), style="white")
                     yield Static(md_text)
-                    yield Static("─" * 60)
+                    yield _sep()
             else:
                 yield Label("[dim]No active mesoscale discussions[/dim]")
 
@@ -316,11 +603,11 @@ class SPCProductsPanel(Static):
             if self.watches:
                 for watch in self.watches:
                     watch_text = Text()
-                    watch_type_color = "bright_red" if "Tornado" in watch['type'] else "yellow"
+                    watch_type_color = _WATCH_TYPE_COLORS.get(watch['type'], "yellow")
                     watch_text.append(f"WATCH #{watch['number']} - ", style="bold")
                     watch_text.append(f"{watch['type']}", style=f"bold {watch_type_color}")
                     yield Static(watch_text)
-                    yield Static("─" * 60)
+                    yield _sep()
             else:
                 yield Label("[dim]No active watches[/dim]")
 
@@ -355,23 +642,13 @@ class LightningPanel(Static):
                 summary.append(f"Trend: {trend_arrow} {trend.upper()}", style=f"bold {trend_color}")
 
                 yield Static(summary)
-                yield Static("─" * 60)
+                yield _sep()
 
             # Recent strikes
             if self.strikes:
                 yield Static(Text("\n📍 RECENT STRIKES", style="bold"))
-                for i, strike in enumerate(self.strikes[:20], 1):
-                    strike_text = Text()
-                    strike_type_color = "red" if strike.type == "CG" else "yellow"
-                    age = format_time_ago(strike.timestamp)
-
-                    strike_text.append(f"{i}. ", style="dim")
-                    strike_text.append(f"[{strike.type}] ", style=f"bold {strike_type_color}")
-                    strike_text.append(f"{strike.latitude:.3f}°N, {strike.longitude:.3f}°W  ", style="white")
-                    strike_text.append(f"{age}  ", style="dim")
-                    strike_text.append(f"{strike.strength:.0f}kA", style="bright_yellow")
-
-                    yield Static(strike_text)
+                for i, strike in enumerate(self.strikes, 1):
+                    yield Static(Text.from_markup(_format_strike(i, strike)))
             else:
                 yield Label("[dim]No recent lightning detected[/dim]")
 
@@ -480,11 +757,25 @@ class WXNETApp(App):
 
         # Data stores
         self.alerts: List[WeatherAlert] = []
+        self._alert_views: List[Text] = []
         self.current_weather: Optional[CurrentWeather] = None
+        # Content hashes of the last fetched alerts, observation and
+        # atmospheric data; an unchanged fetch keeps the previous objects so
+        # the panels' reactives see the same value and don't redraw
+        self._alerts_fingerprint: Optional[int] = None
+        self._weather_fingerprint: Optional[int] = None
+        self._atmos_fingerprint: Optional[int] = None
         self.radar_data = None
-        self.storm_cells: List[StormCell] = []
+        self.radar_station = "KTLX"
+        # ((rounded lat, rounded lon), nearest station) from the last lookup
+        self._station_cache: Optional[Tuple[Tuple[float, float], str]] = None
+        self._cells_task: Optional[asyncio.Task] = None
+        self.storm_cells = StormCellTable.from_cells([])
         self.atmospheric_data: Optional[AtmosphericData] = None
         self.lightning_strikes: List[LightningStrike] = []
+        self._display_strikes: List[LightningStrike] = []
+        self.lightning_analysis: Optional[Dict] = None
+        self.gps_location: Optional[Location] = None
         self.spc_outlook: Optional[Dict] = None
         self.spc_mds: List[Dict] = []
         self.spc_watches: List[Dict] = []
@@ -495,11 +786,53 @@ class WXNETApp(App):
         self.spc_client: Optional[SPCProductsClient] = None
         self.lightning_client: Optional[LightningClient] = None
         self.meso_client: Optional[MesoanalysisClient] = None
+        self._http: Optional[aiohttp.ClientSession] = None
+
+        # Panel references, looked up once in on_mount
+        self._alerts_panel: Optional[AlertsPanel] = None
+        self._current_panel: Optional[CurrentConditionsPanel] = None
+        self._radar_panel: Optional[RadarPanel] = None
+        self._cells_panel: Optional[StormCellsPanel] = None
+        self._atmos_panel: Optional[AtmosphericPanel] = None
+        self._spc_panel: Optional[SPCProductsPanel] = None
+        self._lightning_panel: Optional[LightningPanel] = None
+        self._gps_panel: Optional[GPSPanel] = None
+        self._tabs: Optional[TabbedContent] = None
+
+        # Refresh scheduling: (fetch, show) pair and interval in seconds per source
+        self._refreshers = {
+            "alerts": (self.refresh_alerts, self._show_alerts),
+            "weather": (self.refresh_weather, self._show_weather),
+            "radar": (self.refresh_radar, self._show_radar),
+            "atmospheric": (self.refresh_atmospheric, self._show_atmospheric),
+            "spc": (self.refresh_spc, self._show_spc),
+            "lightning": (self.refresh_lightning, self._show_lightning),
+            "gps": (self.refresh_gps, self._show_gps),
+        }
+        self._refresh_intervals: Dict[str, float] = {
+            "alerts": config.alert_update_interval,
+            "weather": config.weather_update_interval,
+            "radar": config.radar_update_interval,
+            "spc": 30,
+            "lightning": 30,
+            "gps": 5,
+        }
+        self._next_due: Dict[str, float] = {name: 0.0 for name in self._refresh_intervals}
+        self._active_tab = "overview"
+        # Created in on_mount so it binds to the running event loop
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        self._tick_timer: Optional[Timer] = None
 
         # Chase utilities
         self.gps_tracker = GPSTracker()
         self.sound_alerts = SoundAlerts()
-        self.chase_logger = ChaseLogger()
+        self.chase_logger = create_chase_logger()
+
+        # Compile the geodesic and radar kernels up front so the first
+        # compose doesn't stall
+        warmup = np.zeros(2)
+        haversine_batch(0.0, 0.0, warmup, warmup, np.empty(2), np.empty(2))
+        render_radar_text([[0, 0]], 1, 1)
 
         # Try to start GPS
         if self.gps_tracker.start_tracking():
@@ -515,25 +848,25 @@ class WXNETApp(App):
                 with Horizontal():
                     with Vertical(id="left-column"):
                         with Container(classes="panel"):
-                            yield Static("[bold red]⚠️  ACTIVE ALERTS[/bold red]")
+                            yield Static(_ALERTS_HEADER)
                             yield AlertsPanel(id="alerts")
 
                         with Container(classes="panel"):
-                            yield Static("[bold cyan]🌡️  CURRENT CONDITIONS[/bold cyan]")
-                            yield Static(f"[dim]{self.location.name}[/dim]")
+                            yield Static(_CONDITIONS_HEADER)
+                            yield Static(Text(self.location.name, style="dim"))
                             yield CurrentConditionsPanel(id="current")
 
                         with Container(classes="panel"):
-                            yield Static("[bold magenta]📊 ATMOSPHERIC DATA[/bold magenta]")
+                            yield Static(_ATMOS_HEADER)
                             yield AtmosphericPanel(id="atmospheric")
 
                     with Vertical(id="right-column"):
                         with Container(classes="panel"):
-                            yield Static("[bold green]📡 NEXRAD RADAR[/bold green]")
+                            yield Static(_RADAR_HEADER)
                             yield RadarPanel(id="radar")
 
                         with Container(classes="panel"):
-                            yield Static("[bold yellow]⛈️  STORM CELLS[/bold yellow]")
+                            yield Static(_CELLS_HEADER)
                             yield StormCellsPanel(id="cells")
 
             # SPC Products Tab
@@ -555,65 +888,152 @@ class WXNETApp(App):
 
     async def on_mount(self) -> None:
         """Handle mount event."""
-        # Initialize clients
-        self.nws_client = NWSClient()
-        self.nexrad_client = NEXRADClient()
-        self.spc_client = SPCProductsClient()
-        self.lightning_client = LightningClient()
-        self.meso_client = MesoanalysisClient()
-
-        # Start data refresh loops
-        self.set_interval(config.alert_update_interval, self.refresh_alerts)
-        self.set_interval(config.weather_update_interval, self.refresh_weather)
-        self.set_interval(config.radar_update_interval, self.refresh_radar)
-        self.set_interval(30, self.refresh_spc)
-        self.set_interval(30, self.refresh_lightning)
-        self.set_interval(5, self.refresh_gps)
+        # Initialize clients on one shared HTTP session so they reuse
+        # connections instead of each keeping its own pool
+        self._http = create_session()
+        self.nws_client = NWSClient(session=self._http)
+        self.nexrad_client = NEXRADClient(session=self._http)
+        self.meso_client = MesoanalysisClient(session=self._http)
+        # SPC and lightning clients are created on first visit to their tabs
+
+        self._refresh_lock = asyncio.Lock()
+
+        # Cache panel references so refreshes don't walk the DOM each time
+        self._alerts_panel = self.query_one("#alerts", AlertsPanel)
+        self._current_panel = self.query_one("#current", CurrentConditionsPanel)
+        self._radar_panel = self.query_one("#radar", RadarPanel)
+        self._cells_panel = self.query_one("#cells", StormCellsPanel)
+        self._atmos_panel = self.query_one("#atmospheric", AtmosphericPanel)
+        self._spc_panel = self.query_one("#spc-products", SPCProductsPanel)
+        self._lightning_panel = self.query_one("#lightning-panel", LightningPanel)
+        self._gps_panel = self.query_one("#gps-panel", GPSPanel)
+        self._tabs = self.query_one(TabbedContent)
 
         # Initial data load
         await self.refresh_all_data()
 
+        # Start the refresh scheduler; a single tick runs whatever is due so
+        # that sources coming due together are applied in one batch
+        self._tick_timer = self.set_interval(1.0, self._tick)
+
+        # Stop refreshing while the terminal is handed to another process
+        # (suspend/resume signals aren't available on older Textual). Losing
+        # focus alone doesn't pause anything: alerts must keep sounding while
+        # another window is in front.
+        suspend_signal = getattr(self, "app_suspend_signal", None)
+        if suspend_signal is not None:
+            suspend_signal.subscribe(self, self._on_app_suspend)
+            self.app_resume_signal.subscribe(self, self._on_app_resume)
+
     async def on_unmount(self) -> None:
         """Handle unmount event - cleanup resources."""
-        # Close all HTTP client sessions
-        if self.nws_client and self.nws_client.session:
-            await self.nws_client.session.close()
-        if self.nexrad_client and self.nexrad_client.session:
-            await self.nexrad_client.session.close()
-        if self.spc_client and self.spc_client.session:
-            await self.spc_client.session.close()
-        if self.lightning_client and self.lightning_client.session:
-            await self.lightning_client.session.close()
-        if self.meso_client and self.meso_client.session:
-            await self.meso_client.session.close()
+        if self._cells_task:
+            self._cells_task.cancel()
+
+        # Close the shared HTTP session used by all clients
+        if self._http:
+            await self._http.close()
 
         # Stop GPS tracking
         if self.gps_tracker:
             self.gps_tracker.stop_tracking()
 
-    async def refresh_all_data(self) -> None:
-        """Refresh all weather data."""
+    async def _tick(self) -> None:
+        """Run every refresh that has come due since the last tick."""
+        now = time.monotonic()
+        due = [
+            name for name, due_at in self._next_due.items()
+            if now >= due_at and self._source_visible(name)
+        ]
+        if due:
+            await self._run_refreshes(due)
+
+    def _source_visible(self, name: str) -> bool:
+        """Check whether a data source's panel is currently on screen.
+
+        Hidden tab-only sources stay due and are picked up on the first tick
+        after their tab is shown.
+
+        Args:
+            name: Key of self._refreshers
+
+        Returns:
+            True if the source should be refreshed now
+        """
+        tab = _TAB_GATED_SOURCES.get(name)
+        return tab is None or tab == self._active_tab
+
+    def _on_app_suspend(self, app: App) -> None:
+        """Pause the refresh scheduler while the app is suspended."""
+        if self._tick_timer:
+            self._tick_timer.pause()
+
+    def _on_app_resume(self, app: App) -> None:
+        """Resume the refresh scheduler; anything that came due runs on the next tick."""
+        if self._tick_timer:
+            self._tick_timer.resume()
+
+    def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
+        """Track the visible tab for refresh gating."""
+        self._active_tab = event.tabbed_content.active
+
+    async def _run_refreshes(self, names: List[str]) -> None:
+        """Fetch the named sources concurrently, then update their widgets together.
+
+        Args:
+            names: Keys of self._refreshers to run
+        """
+        now = time.monotonic()
+        for name in names:
+            if name in self._refresh_intervals:
+                self._next_due[name] = now + self._refresh_intervals[name]
+
+        # Bound each fetch so one stalled endpoint doesn't hold up the others
         await asyncio.gather(
-            self.refresh_alerts(),
-            self.refresh_weather(),
-            self.refresh_radar(),
-            self.refresh_atmospheric(),
-            self.refresh_spc(),
-            self.refresh_lightning(),
+            *(asyncio.wait_for(self._refreshers[name][0](), timeout=_FETCH_TIMEOUT) for name in names),
             return_exceptions=True
         )
 
+        with self.batch_update():
+            for name in names:
+                try:
+                    self._refreshers[name][1]()
+                except Exception as e:
+                    self.log(f"Error updating {name} display: {e}")
+
+    async def refresh_all_data(self) -> None:
+        """Refresh all weather data."""
+        # Coalesce: a refresh requested while one is running would only
+        # repeat the same requests
+        if self._refresh_lock.locked():
+            return
+
+        async with self._refresh_lock:
+            await self._run_refreshes([
+                name for name in ("alerts", "weather", "radar", "atmospheric", "spc", "lightning")
+                if self._source_visible(name)
+            ])
+
     async def refresh_alerts(self) -> None:
         """Refresh weather alerts."""
         if self.nws_client:
-            self.alerts = await self.nws_client.get_alerts(
+            alerts = await self.nws_client.get_alerts(
                 self.location.latitude,
                 self.location.longitude
             )
 
-            # Update UI
-            alerts_widget = self.query_one("#alerts", AlertsPanel)
-            alerts_widget.alerts = self.alerts
+            fingerprint = hash(tuple((a.id, a.event, a.expires) for a in alerts))
+            if fingerprint != self._alerts_fingerprint:
+                self._alerts_fingerprint = fingerprint
+                self.alerts = alerts
+
+                # Truncate descriptions once here rather than on every recompose
+                for alert in self.alerts:
+                    desc = alert.description or ""
+                    alert._short_desc = desc[:200] + "..." if len(desc) > 200 else desc
+
+                # Prebuild display text so AlertsPanel compose does no formatting
+                self._alert_views = [_build_alert_text(alert) for alert in self.alerts]
 
             # Play sound for new tornado warnings
             for alert in self.alerts:
@@ -621,104 +1041,200 @@ class WXNETApp(App):
                     self.sound_alerts.play_tornado_warning()
                     break
 
+    def _show_alerts(self) -> None:
+        """Push weather alerts to the UI."""
+        alerts_widget = self._alerts_panel
+        alerts_widget.alerts = self._alert_views
+
     async def refresh_weather(self) -> None:
         """Refresh current weather."""
         if self.nws_client:
-            self.current_weather = await self.nws_client.get_observation(
+            weather = await self.nws_client.get_observation(
                 self.location.latitude,
                 self.location.longitude
             )
 
-            current_widget = self.query_one("#current", CurrentConditionsPanel)
-            current_widget.weather = self.current_weather
+            # Stations report roughly hourly; most polls return the same observation
+            fingerprint = hash(weather.timestamp) if weather else None
+            if fingerprint != self._weather_fingerprint:
+                self._weather_fingerprint = fingerprint
+                self.current_weather = weather
+                if weather:
+                    weather._epoch = int(weather.timestamp.timestamp())
+
+    def _show_weather(self) -> None:
+        """Push current weather to the UI."""
+        current_widget = self._current_panel
+        current_widget.weather = self.current_weather
 
     async def refresh_radar(self) -> None:
         """Refresh radar data."""
         if self.nexrad_client:
-            # Find nearest station
-            stations = self.nexrad_client.find_nearest_stations(
-                self.location.latitude,
-                self.location.longitude,
-                count=1
-            )
-            station = stations[0][0] if stations else "KTLX"
+            # Find nearest station, reusing the last answer until we've moved
+            # roughly a kilometer
+            station_key = (round(self.location.latitude, 2), round(self.location.longitude, 2))
+            if self._station_cache and self._station_cache[0] == station_key:
+                self.radar_station = self._station_cache[1]
+            else:
+                stations = self.nexrad_client.find_nearest_stations(
+                    self.location.latitude,
+                    self.location.longitude,
+                    count=1
+                )
+                self.radar_station = stations[0][0] if stations else "KTLX"
+                self._station_cache = (station_key, self.radar_station)
 
             # Get radar data
             self.radar_data = await self.nexrad_client.get_reflectivity_data(
-                station,
+                self.radar_station,
                 self.location.latitude,
                 self.location.longitude
             )
 
             if self.radar_data:
-                # Detect storm cells
-                self.storm_cells = await self.nexrad_client.detect_storm_cells(
-                    self.radar_data,
-                    threshold_dbz=40
+                self.radar_data._time_str = self.radar_data.timestamp.strftime('%H:%M:%S UTC')
+
+                # Quantize and render the ASCII radar on a worker thread so the
+                # event loop stays free for input and other fetches; cell
+                # detection reuses the quantized grid
+                loop = asyncio.get_running_loop()
+                self.radar_data._grid = await loop.run_in_executor(
+                    None, quantize_reflectivity, self.radar_data.data
+                )
+                self.radar_data._ascii = await loop.run_in_executor(
+                    None, render_radar_text, self.radar_data._grid, 100, 40
                 )
 
-                # Update UI
-                radar_widget = self.query_one("#radar", RadarPanel)
-                radar_widget.radar_data = self.radar_data
-                radar_widget.station = station
+                # Detect storm cells in the background so the radar image and
+                # the rest of this tick's updates don't wait on it
+                self._cells_task = asyncio.create_task(self._detect_cells(self.radar_data))
+
+    async def _detect_cells(self, radar_data: Any) -> None:
+        """Detect storm cells in radar data and push them to the UI.
+
+        Args:
+            radar_data: Radar data to scan
+        """
+        try:
+            # Detection is CPU-bound; run it on a worker thread so alerts and
+            # weather fetches keep being serviced meanwhile
+            loop = asyncio.get_running_loop()
+            self.storm_cells = await loop.run_in_executor(
+                None, self.nexrad_client.detect_storm_cells_sync, radar_data, 40
+            )
+        except Exception as e:
+            self.log(f"Error detecting storm cells: {e}")
+            return
 
-                cells_widget = self.query_one("#cells", StormCellsPanel)
-                cells_widget.cells = self.storm_cells
-                cells_widget.location = (self.location.latitude, self.location.longitude)
-                cells_widget.gps_tracker = self.gps_tracker
+        # Cells go last: assigning them redraws using the location and tracker
+        cells_widget = self._cells_panel
+        cells_widget.location = (self.location.latitude, self.location.longitude)
+        cells_widget.gps_tracker = self.gps_tracker
+        cells_widget.cells = self.storm_cells
+
+    def _show_radar(self) -> None:
+        """Push radar data to the UI."""
+        if not self.radar_data:
+            return
+
+        # Station goes first: assigning the data redraws the header with it
+        radar_widget = self._radar_panel
+        radar_widget.station = self.radar_station
+        radar_widget.radar_data = self.radar_data
 
     async def refresh_atmospheric(self) -> None:
         """Refresh atmospheric data."""
         if self.meso_client:
-            self.atmospheric_data = await self.meso_client.get_atmospheric_parameters(
+            atmos = await self.meso_client.get_atmospheric_parameters(
                 self.location.latitude,
                 self.location.longitude
             )
 
-            atmos_widget = self.query_one("#atmospheric", AtmosphericPanel)
-            atmos_widget.atmos_data = self.atmospheric_data
+            # The analysis is stamped at fetch time, so compare the parameters
+            fingerprint = hash((
+                atmos.cape, atmos.cin, atmos.helicity, atmos.shear,
+                atmos.lifted_index, atmos.k_index, atmos.total_totals
+            )) if atmos else None
+            if fingerprint != self._atmos_fingerprint:
+                self._atmos_fingerprint = fingerprint
+                self.atmospheric_data = atmos
+                if atmos:
+                    atmos._epoch = int(atmos.timestamp.timestamp())
+
+    def _show_atmospheric(self) -> None:
+        """Push atmospheric data to the UI."""
+        atmos_widget = self._atmos_panel
+        atmos_widget.atmos_data = self.atmospheric_data
+
+    async def _get_spc_client(self) -> SPCProductsClient:
+        """Get the SPC client, creating it on first use."""
+        if self.spc_client is None:
+            self.spc_client = SPCProductsClient(session=self._http)
+        return self.spc_client
+
+    async def _get_lightning_client(self) -> LightningClient:
+        """Get the lightning client, creating it on first use."""
+        if self.lightning_client is None:
+            self.lightning_client = LightningClient(session=self._http)
+        return self.lightning_client
 
     async def refresh_spc(self) -> None:
         """Refresh SPC products."""
-        if self.spc_client:
-            summary = await self.spc_client.get_severe_weather_summary()
+        spc_client = await self._get_spc_client()
+        summary = await spc_client.get_severe_weather_summary()
 
-            self.spc_outlook = summary.get("outlooks", {}).get("day1")
-            self.spc_mds = summary.get("mesoscale_discussions", [])
-            self.spc_watches = summary.get("watches", [])
+        self.spc_outlook = summary.get("outlooks", {}).get("day1")
+        self.spc_mds = summary.get("mesoscale_discussions", [])
+        self.spc_watches = summary.get("watches", [])
 
-            spc_widget = self.query_one("#spc-products", SPCProductsPanel)
-            spc_widget.outlook = self.spc_outlook
-            spc_widget.mds = self.spc_mds
-            spc_widget.watches = self.spc_watches
+    def _show_spc(self) -> None:
+        """Push SPC products to the UI."""
+        spc_widget = self._spc_panel
+        spc_widget.outlook = self.spc_outlook
+        spc_widget.mds = self.spc_mds
+        spc_widget.watches = self.spc_watches
 
     async def refresh_lightning(self) -> None:
         """Refresh lightning data."""
-        if self.lightning_client:
-            self.lightning_strikes = await self.lightning_client.get_recent_strikes(
-                self.location.latitude,
-                self.location.longitude,
-                radius_km=300,
-                minutes=15
-            )
+        lightning_client = await self._get_lightning_client()
+        self.lightning_strikes = await lightning_client.get_recent_strikes(
+            self.location.latitude,
+            self.location.longitude,
+            radius_km=300,
+            minutes=15
+        )
 
-            analysis = self.lightning_client.analyze_storm_electrification(
-                self.lightning_strikes,
-                time_window_minutes=15
-            )
+        self.lightning_analysis = lightning_client.analyze_storm_electrification(
+            self.lightning_strikes,
+            time_window_minutes=15
+        )
 
-            ltg_widget = self.query_one("#lightning-panel", LightningPanel)
-            ltg_widget.strikes = self.lightning_strikes
-            ltg_widget.analysis = analysis
+        # The panel only lists the most recent strikes; hand it just those,
+        # with their ages formatted once here instead of on every recompose
+        self._display_strikes = self.lightning_strikes[:_MAX_DISPLAY_STRIKES]
+        times = np.array(
+            [int(strike.timestamp.timestamp()) for strike in self._display_strikes],
+            dtype="datetime64[s]"
+        )
+        for strike, age in zip(self._display_strikes, format_time_ago_vec(times)):
+            strike._age_str = age
+
+    def _show_lightning(self) -> None:
+        """Push lightning data to the UI."""
+        ltg_widget = self._lightning_panel
+        ltg_widget.strikes = self._display_strikes
+        ltg_widget.analysis = self.lightning_analysis
 
     async def refresh_gps(self) -> None:
         """Refresh GPS location."""
-        location = self.gps_tracker.get_current_location()
-        if location:
-            self.location = location
-
-        gps_widget = self.query_one("#gps-panel", GPSPanel)
-        gps_widget.location = location
+        self.gps_location = self.gps_tracker.get_current_location()
+        if self.gps_location:
+            self.location = self.gps_location
+
+    def _show_gps(self) -> None:
+        """Push GPS location to the UI."""
+        gps_widget = self._gps_panel
+        gps_widget.location = self.gps_location
         gps_widget.gps_enabled = self.gps_tracker.is_tracking
 
     def action_refresh_all(self) -> None:
@@ -727,23 +1243,19 @@ class WXNETApp(App):
 
     def action_show_overview(self) -> None:
         """Show overview tab."""
-        tabs = self.query_one(TabbedContent)
-        tabs.active = "overview"
+        self._tabs.active = "overview"
 
     def action_show_spc(self) -> None:
         """Show SPC products tab."""
-        tabs = self.query_one(TabbedContent)
-        tabs.active = "spc"
+        self._tabs.active = "spc"
 
     def action_show_lightning(self) -> None:
         """Show lightning tab."""
-        tabs = self.query_one(TabbedContent)
-        tabs.active = "lightning"
+        self._tabs.active = "lightning"
 
     def action_show_gps(self) -> None:
         """Show GPS tab."""
-        tabs = self.query_one(TabbedContent)
-        tabs.active = "gps"
+        self._tabs.active = "gps"
 
     def action_toggle_sound(self) -> None:
         """Toggle sound alerts."""
@@ -752,8 +1264,26 @@ class WXNETApp(App):
         self.notify(f"Sound alerts {status}")
 
 
+def _install_event_loop_policy() -> None:
+    """Switch to a faster event loop implementation when one is installed."""
+    if sys.platform.startswith("linux"):
+        try:
+            import uringcore
+            asyncio.set_event_loop_policy(uringcore.EventLoopPolicy())
+            return
+        except ImportError:
+            pass
+
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+
 def main():
     """Main entry point."""
+    _install_event_loop_policy()
     app = WXNETApp()
     app.run()
 
@@ -1,73 +1,81 @@
 """Configuration management for WXNET."""
 
 import os
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Any, Optional
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
 
-class Config(BaseModel):
+@dataclass(frozen=True)
+class Config:
     """Application configuration."""
 
     # Location settings
-    default_latitude: float = Field(default=35.0)
-    default_longitude: float = Field(default=-97.5)
-    default_location: str = Field(default="Oklahoma City, OK")
+    default_latitude: float = 35.0
+    default_longitude: float = -97.5
+    default_location: str = "Oklahoma City, OK"
 
     # API settings
-    openweather_api_key: Optional[str] = Field(default=None)
-    nws_user_agent: str = Field(
-        default="WXNET Weather Terminal (github.com/wxnet/wxnet)"
-    )
+    openweather_api_key: Optional[str] = None
+    nws_user_agent: str = "WXNET Weather Terminal (github.com/wxnet/wxnet)"
 
     # Update intervals (seconds)
-    weather_update_interval: int = Field(default=300)
-    alert_update_interval: int = Field(default=60)
-    radar_update_interval: int = Field(default=120)
-    lightning_update_interval: int = Field(default=30)
+    weather_update_interval: int = 300
+    alert_update_interval: int = 60
+    radar_update_interval: int = 120
+    lightning_update_interval: int = 30
 
     # Display settings
-    use_color: bool = Field(default=True)
-    alert_sound: bool = Field(default=False)
-    animation_speed: str = Field(default="medium")
+    use_color: bool = True
+    alert_sound: bool = False
+    animation_speed: str = "medium"
+
+    # Chase log format: "json" (one JSON object per line) or "msgpack"
+    chase_log_format: str = "json"
 
     # Data cache directory
-    cache_dir: Path = Field(default=Path.home() / ".wxnet" / "cache")
-
-    class Config:
-        """Pydantic configuration."""
-        env_prefix = ""
-        case_sensitive = False
-
-    def __init__(self, **data):
-        """Initialize configuration from environment variables."""
-        # Override defaults with environment variables
-        env_data = {
-            "default_latitude": float(os.getenv("DEFAULT_LATITUDE", "35.0")),
-            "default_longitude": float(os.getenv("DEFAULT_LONGITUDE", "-97.5")),
-            "default_location": os.getenv("DEFAULT_LOCATION", "Oklahoma City, OK"),
-            "openweather_api_key": os.getenv("OPENWEATHER_API_KEY"),
-            "nws_user_agent": os.getenv(
-                "NWS_USER_AGENT",
-                "WXNET Weather Terminal (github.com/wxnet/wxnet)"
-            ),
-            "weather_update_interval": int(os.getenv("WEATHER_UPDATE_INTERVAL", "300")),
-            "alert_update_interval": int(os.getenv("ALERT_UPDATE_INTERVAL", "60")),
-            "radar_update_interval": int(os.getenv("RADAR_UPDATE_INTERVAL", "120")),
-            "use_color": os.getenv("USE_COLOR", "true").lower() == "true",
-            "alert_sound": os.getenv("ALERT_SOUND", "false").lower() == "true",
-            "animation_speed": os.getenv("ANIMATION_SPEED", "medium"),
-        }
-        env_data.update(data)
-        super().__init__(**env_data)
-
-        # Ensure cache directory exists
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_dir: Path = field(default_factory=lambda: Path.home() / ".wxnet" / "cache")
+
+
+def _parse(field_type: Any, raw: str) -> Any:
+    """Convert an environment variable value to a config field's type."""
+    if field_type is bool:
+        return raw.lower() == "true"
+    if field_type in (int, float, Path):
+        return field_type(raw)
+    return raw
+
+
+def _load(**overrides) -> Config:
+    """Build the configuration from environment variables.
+
+    Every field can be set from the environment variable of the same name
+    in upper case (e.g. DEFAULT_LATITUDE); the dataclass defaults apply
+    otherwise.
+
+    Args:
+        **overrides: Values that take precedence over the environment
+
+    Returns:
+        Configuration instance
+    """
+    env_data = {}
+    for f in fields(Config):
+        raw = os.getenv(f.name.upper())
+        if raw is not None:
+            env_data[f.name] = _parse(f.type, raw)
+    env_data.update(overrides)
+    cfg = Config(**env_data)
+
+    # Ensure cache directory exists
+    cfg.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    return cfg
 
 
 # Global configuration instance
-config = Config()
+config = _load()
@@ -4,68 +4,528 @@ Professional severe weather monitoring with rich visualizations
 """
 
 import sys
+import time
 import asyncio
-from datetime import datetime
-from typing import Optional, List, Dict, Any
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Callable, Tuple
+
+import aiohttp
+import numpy as np
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QTabWidget, QLabel, QPushButton, QTextEdit, QSplitter, QStatusBar,
-    QMenuBar, QMenu, QToolBar, QTableWidget, QTableWidgetItem,
-    QScrollArea, QFrame, QGridLayout, QSystemTrayIcon, QMessageBox,
-    QProgressBar, QGroupBox
+    QToolBar, QScrollArea, QFrame, QGridLayout, QMessageBox
 )
 from PyQt6.QtCore import (
-    Qt, QTimer, QThread, pyqtSignal, QSize, QSettings
+    Qt, QEvent, QObject, QTimer, QThread, pyqtSignal, QSize
 )
 from PyQt6.QtGui import (
-    QAction, QIcon, QFont, QColor, QPalette, QTextCharFormat,
-    QTextCursor, QPixmap
+    QAction, QFont, QColor, QPixmap, QPainter, QTextDocument
 )
 
 # Import WXNET backend
 from .config import config
-from .models import WeatherAlert, CurrentWeather, StormCell, AtmosphericData, LightningStrike, Location
+from .models import (
+    WeatherAlert, AlertSeverity, CurrentWeather, StormCellTable, AtmosphericData, Location
+)
+from .api import create_session
 from .api.nws import NWSClient
 from .api.nexrad import NEXRADClient
-from .api.spc import SPCProductsClient
-from .api.lightning import LightningClient
 from .api.mesoanalysis import MesoanalysisClient
-from .tracking import GPSTracker, SoundAlerts, ChaseLogger
+from .tracking import GPSTracker, SoundAlerts, create_chase_logger
 from .utils import (
     format_temperature, format_wind, format_pressure,
-    get_alert_color, format_distance, calculate_distance,
-    calculate_bearing, format_bearing, format_time_ago,
+    format_distance, calculate_distance_bearing_batch,
+    format_bearing_batch, format_time_ago,
     format_cape, format_helicity
 )
 
 
-class DataFetchThread(QThread):
-    """Thread for fetching weather data without blocking UI."""
+# Alert severity colors, and each severity's alert block opening with the
+# colors filled in, so an update only substitutes the alert's own fields
+_SEVERITY_COLORS: Dict[str, str] = {
+    "EXTREME": "#ff0066",
+    "SEVERE": "#ff4444",
+    "MODERATE": "#ff8800",
+    "MINOR": "#ffcc00",
+    "UNKNOWN": "#888888"
+}
+_ALERT_BLOCK_OPEN: Dict[str, str] = {
+    severity: (
+        f"<div style='border-left: 4px solid {color}; padding: 10px; margin: 10px 0; background: #2a2a2a;'>"
+        f"<h3 style='color: {color}; margin: 0;'>"
+    )
+    for severity, color in _SEVERITY_COLORS.items()
+}
+
+# Storm cell border colors indexed by whole dBZ (>60, >50, otherwise);
+# intensities are clamped into the table
+_INTENSITY_HEX: List[str] = [
+    "#ff4444" if dbz > 60 else "#ffff44" if dbz > 50 else "#44ff44"
+    for dbz in range(120)
+]
+
+# Green/yellow/red for atmospheric parameters by threat level
+_LOW, _MID, _HIGH = "#44ff44", "#ffff44", "#ff4444"
+
+# Adaptive polling: alerts and radar speed up to this during active weather,
+# weather and radar back off by doubling up to the cap once alerts and cells
+# have been unchanged for this many alert refreshes in a row
+_ACTIVE_INTERVAL_MS = 15_000
+_MAX_INTERVAL_MS = 600_000
+_STABLE_ROUNDS = 3
+_ACTIVE_SEVERITIES = (AlertSeverity.SEVERE, AlertSeverity.EXTREME)
+_ACTIVE_CELL_DBZ = 55
+
+# Application style sheet, set once on the QApplication. Widgets pick their
+# variant by object name or "role" property instead of carrying their own sheet.
+DARK_QSS = """
+QMainWindow {
+    background-color: #1a1a1a;
+}
+QWidget {
+    background-color: #1a1a1a;
+    color: #ffffff;
+}
+QTextEdit {
+    background-color: #2a2a2a;
+    color: #ffffff;
+    border: 1px solid #444;
+    border-radius: 5px;
+    padding: 5px;
+}
+QTabWidget::pane {
+    border: 1px solid #444;
+    background-color: #1a1a1a;
+}
+QTabBar::tab {
+    background-color: #2a2a2a;
+    color: #ffffff;
+    padding: 10px 20px;
+    margin: 2px;
+    border: 1px solid #444;
+    border-radius: 5px 5px 0 0;
+}
+QTabBar::tab:selected {
+    background-color: #3a3a3a;
+    border-bottom: 2px solid #44aaff;
+}
+QPushButton {
+    background-color: #3a3a3a;
+    color: #ffffff;
+    border: 1px solid #555;
+    border-radius: 5px;
+    padding: 8px 15px;
+    font-weight: bold;
+}
+QPushButton:hover {
+    background-color: #4a4a4a;
+    border: 1px solid #44aaff;
+}
+QPushButton:pressed {
+    background-color: #2a2a2a;
+}
+QMenuBar {
+    background-color: #2a2a2a;
+    color: #ffffff;
+}
+QMenuBar::item:selected {
+    background-color: #3a3a3a;
+}
+QMenu {
+    background-color: #2a2a2a;
+    color: #ffffff;
+    border: 1px solid #444;
+}
+QMenu::item:selected {
+    background-color: #44aaff;
+}
+QToolBar {
+    background-color: #2a2a2a;
+    border: 1px solid #444;
+    spacing: 5px;
+    padding: 5px;
+}
+QStatusBar {
+    background-color: #2a2a2a;
+    color: #aaa;
+}
+QLabel {
+    color: #ffffff;
+}
+
+/* Panel and tab headers */
+QLabel#alertsHeader { color: #ff4444; padding: 5px; }
+QLabel#weatherHeader { color: #44aaff; padding: 5px; }
+QLabel#radarHeader { color: #44ff44; padding: 5px; }
+QLabel#cellsHeader { color: #ffff44; padding: 5px; }
+QLabel#atmosphericHeader { color: #ff44ff; padding: 5px; }
+QLabel#spcHeader, QLabel#lightningHeader { color: #ffff44; padding: 10px; }
+QLabel#gpsHeader { color: #44ff44; padding: 10px; }
+
+/* Panel contents */
+QLabel#locationLabel { color: #888; font-size: 10pt; }
+QLabel#stationLabel { color: #aaa; }
+QLabel[role="field-name"] { color: #44aaff; }
+QLabel[role="field-value"] { color: #fff; font-size: 11pt; }
+QLabel[role="placeholder"] { color: #888; }
+QTextEdit#radarText { background: #000; color: #0f0; }
+QFrame#cellRow QLabel { background: transparent; }
+"""
+
+# Minimum gap between manual (F5 / toolbar) refreshes, in seconds
+_MANUAL_REFRESH_GAP_S = 120
+
+
+@lru_cache(maxsize=1)
+def _clock_text(seconds: int) -> str:
+    """Local HH:MM:SS for an epoch second, reused within the same second."""
+    return time.strftime('%H:%M:%S', time.localtime(seconds))
+
+
+class AsyncWorker(QThread):
+    """Background thread running one persistent asyncio event loop.
+
+    Fetches are submitted from the UI thread and their results are delivered
+    back to it through a queued signal, so every refresh shares the same
+    loop and HTTP connections instead of starting a thread and loop each.
+    Blocking work the fetches hand to run_in_executor goes to one small
+    named pool owned by the worker. A new fetch of a data type supersedes
+    (cancels) one of the same type still in flight. Periodic refreshes are
+    scheduled as sleeping tasks on the same loop.
+    """
 
     data_ready = pyqtSignal(str, object)  # (data_type, data)
     error_occurred = pyqtSignal(str, str)  # (data_type, error_message)
+    _finished = pyqtSignal(str, object, object)  # (data_type, callback, future)
+    _due = pyqtSignal(object)  # callback of a periodic schedule
 
-    def __init__(self, data_type: str, fetch_func, *args, **kwargs):
+    def __init__(self):
         super().__init__()
-        self.data_type = data_type
-        self.fetch_func = fetch_func
-        self.args = args
-        self.kwargs = kwargs
+        self.loop = asyncio.new_event_loop()
+        self.pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="wxnet")
+        self.loop.set_default_executor(self.pool)
+        # data_type -> future of its newest fetch; only the UI thread touches this
+        self._in_flight: Dict[str, Any] = {}
+        # name -> task of a periodic schedule; only the worker loop touches this
+        self._periodic: Dict[str, asyncio.Task] = {}
+        self._finished.connect(self._deliver)
+        self._due.connect(self._run_due)
 
     def run(self):
-        """Run the data fetch in background."""
+        """Run the event loop until stop() is called."""
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, data_type: str, coro, callback):
+        """Schedule a coroutine on the worker loop.
+
+        Args:
+            data_type: Name of the data being fetched, for signals and errors
+            coro: Coroutine to run
+            callback: Called on the UI thread with the coroutine's result
+        """
+        previous = self._in_flight.get(data_type)
+        if previous is not None:
+            previous.cancel()
+
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        self._in_flight[data_type] = future
+        future.add_done_callback(lambda f: self._finished.emit(data_type, callback, f))
+
+    def every(self, name: str, interval_ms: int, callback: Callable[[], None]):
+        """Call a function on the UI thread every interval_ms.
+
+        Scheduling a name again replaces its previous schedule, restarting
+        the wait from now.
+
+        Args:
+            name: Schedule name
+            interval_ms: Milliseconds between calls
+            callback: Called on the UI thread with no arguments
+        """
+        self.loop.call_soon_threadsafe(self._start_periodic, name, interval_ms / 1000, callback)
+
+    def _start_periodic(self, name: str, interval: float, callback):
+        """Replace a periodic schedule; runs on the worker loop."""
+        previous = self._periodic.pop(name, None)
+        if previous is not None:
+            previous.cancel()
+        self._periodic[name] = self.loop.create_task(self._periodic_loop(interval, callback))
+
+    async def _periodic_loop(self, interval: float, callback):
+        """Wake every interval seconds and hand callback to the UI thread."""
+        while True:
+            await asyncio.sleep(interval)
+            self._due.emit(callback)
+
+    def _run_due(self, callback):
+        """Run a periodic callback on the UI thread unless the loop has stopped."""
+        if not self.loop.is_closed():
+            callback()
+
+    def run_blocking(self, coro, timeout: Optional[float] = None):
+        """Run a coroutine on the worker loop and wait for its result.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait
+
+        Returns:
+            The coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+    def stop(self, *closers):
+        """Stop the event loop and wait for the thread to exit.
+
+        Args:
+            *closers: Cleanup coroutines (e.g. session.close()) to run on the
+                loop, together, once in-flight fetches have been cancelled
+        """
         try:
-            # Run async function in new event loop
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(self.fetch_func(*self.args, **self.kwargs))
-            loop.close()
+            self.run_blocking(self._shutdown(closers), timeout=5)
+        except Exception:
+            pass
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.wait()
+        # Closing the loop also shuts down its default executor (the pool)
+        self.loop.close()
+
+    async def _shutdown(self, closers):
+        """Cancel fetches still in flight, wait for them to unwind, then run closers."""
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await asyncio.gather(*closers, return_exceptions=True)
+
+    def _deliver(self, data_type: str, callback, future):
+        """Hand a finished fetch's result to its callback on the UI thread."""
+        if self._in_flight.get(data_type) is future:
+            del self._in_flight[data_type]
+        if future.cancelled():
+            return
 
-            self.data_ready.emit(self.data_type, result)
+        try:
+            result = future.result()
         except Exception as e:
-            self.error_occurred.emit(self.data_type, str(e))
+            self.error_occurred.emit(data_type, str(e))
+            return
+
+        self.data_ready.emit(data_type, result)
+        callback(result)
+
+
+class RenderBatcher(QObject):
+    """Collects panel updates and applies them together once per frame.
+
+    Fetches finish at different times; batching their panel writes means the
+    window is laid out and repainted once for all of them instead of once
+    per panel. While can_flush returns False the updates stay queued (only
+    the newest per panel) until the next force_flush.
+    """
+
+    def __init__(
+        self,
+        target: QWidget,
+        interval_ms: int = 16,
+        can_flush: Optional[Callable[[], bool]] = None
+    ):
+        super().__init__(target)
+        self.target = target
+        self.can_flush = can_flush
+        self._pending: Dict[str, Callable[[], None]] = {}
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._flush)
+
+    def submit(self, key: str, update: Callable[[], None]):
+        """Queue a panel update for the next flush.
+
+        Args:
+            key: Panel name; a newer update for the same panel replaces the queued one
+            update: Callable that writes the panel
+        """
+        self._pending[key] = update
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def force_flush(self):
+        """Apply queued updates now, deferred or not."""
+        self._timer.stop()
+        self._apply()
+
+    def _flush(self):
+        """Apply queued updates unless they're being deferred."""
+        if self.can_flush is None or self.can_flush():
+            self._apply()
+
+    def _apply(self):
+        """Apply all queued updates with repaints held off."""
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, {}
+        self.target.setUpdatesEnabled(False)
+        try:
+            for update in pending.values():
+                update()
+        finally:
+            self.target.setUpdatesEnabled(True)
+
+
+def format_alerts_html(
+    alerts: List[WeatherAlert],
+    fragments: Dict[str, tuple]
+) -> Tuple[str, Dict[str, tuple]]:
+    """Build the alerts panel document.
+
+    Pure string work with no Qt calls, so it can run off the UI thread.
+
+    Args:
+        alerts: Active alerts
+        fragments: Fragments returned by the previous call, reused for alerts
+            whose displayed fields haven't changed
+
+    Returns:
+        Tuple of (HTML document, fragments to pass to the next call)
+    """
+    if not alerts:
+        return "<p style='color: #888;'>No active alerts</p>", {}
+
+    # Reuse each alert's fragment from the last update unless something
+    # it shows has changed
+    new_fragments = {}
+    parts = []
+    for alert in alerts:
+        description = (alert.description or "")[:200]
+        expires = format_time_ago(alert.expires) if alert.expires else "Unknown"
+        fields = (alert.event, alert.severity, tuple(alert.areas[:3]), description, expires)
+
+        cached = fragments.get(alert.id)
+        if cached is not None and cached[0] == fields:
+            fragment = cached[1]
+        else:
+            block_open = _ALERT_BLOCK_OPEN.get(
+                alert.severity.value.upper(), _ALERT_BLOCK_OPEN["UNKNOWN"]
+            )
+            fragment = "".join((
+                block_open, alert.event, "</h3>",
+                "<p style='color: #aaa; margin: 5px 0;'>", ", ".join(alert.areas[:3]), "</p>",
+                "<p style='color: #fff; margin: 5px 0;'>", description, "...</p>",
+                "<p style='color: #ffa500; margin: 5px 0;'>Expires: ", expires, "</p>",
+                "</div>",
+            ))
+
+        new_fragments[alert.id] = (fields, fragment)
+        parts.append(fragment)
+
+    return "".join(parts), new_fragments
+
+
+def format_cell_rows(cells: StormCellTable, location: tuple) -> List[Tuple[str, str, str]]:
+    """Build the text of each storm cells panel row.
+
+    Pure string and NumPy work with no Qt calls, so it can run off the UI
+    thread.
+
+    Args:
+        cells: Detected storm cells
+        location: (latitude, longitude) distances and bearings are measured from
+
+    Returns:
+        List of (border color, title HTML, details HTML), one per cell
+    """
+    if not cells:
+        return []
+
+    lat, lon = location
+    rows = []
+
+    # Distance and bearing to every cell in one pass
+    dists, bearings = calculate_distance_bearing_batch(lat, lon, cells.lats, cells.lons)
+    bearings = bearings.astype(np.int32)
+    bearing_strs = format_bearing_batch(bearings)
+    movement_strs = format_bearing_batch(cells.movement_directions)
+    color_idx = np.clip(cells.intensities, 0, len(_INTENSITY_HEX) - 1)
+
+    # Convert the columns to Python values once rather than per cell
+    columns = zip(
+        cells, dists.tolist(), bearings.tolist(), color_idx.tolist(),
+        bearing_strs, movement_strs
+    )
+
+    for i, (cell, dist, bearing, color, bearing_str, movement_str) in enumerate(columns, 1):
+        intensity_color = _INTENSITY_HEX[color]
+
+        warnings = []
+        if cell.tvs:
+            warnings.append("<span style='color: #ff0066; font-weight: bold;'>[TVS]</span> ")
+        if cell.meso:
+            warnings.append("<span style='color: #ff4444; font-weight: bold;'>[MESO]</span> ")
+        if cell.max_hail_size and cell.max_hail_size > 1.0:
+            warnings.append(f"<span style='color: #ff00ff; font-weight: bold;'>[HAIL {cell.max_hail_size}\"]</span> ")
+
+        title = f"<h3 style='color: {intensity_color}; margin: 0;'>CELL {i}: {cell.intensity} dBZ {''.join(warnings)}</h3>"
+        parts = [f"""
+            <p style='margin: 5px 0;'>📍 Location: {format_distance(dist)} {bearing_str} ({bearing}°)</p>
+            <p style='margin: 5px 0;'>🎯 Coordinates: {cell.latitude:.3f}°N, {cell.longitude:.3f}°W</p>
+            <p style='margin: 5px 0;'>➡️  Movement: {movement_str} @ {cell.movement_speed:.0f} mph</p>
+        """]
+
+        if cell.has_rotation:
+            parts.append(f"<p style='color: #ff4444; margin: 5px 0;'>🌪️  Rotation: {cell.rotation_strength:.4f}</p>")
+        if cell.top_height:
+            parts.append(f"<p style='color: #44aaff; margin: 5px 0;'>⬆️  Top: {cell.top_height:,} ft</p>")
+
+        rows.append((intensity_color, title, "".join(parts)))
+
+    return rows
+
+
+def format_atmospheric_html(data: Optional[AtmosphericData]) -> str:
+    """Build the atmospheric panel document.
+
+    Args:
+        data: Atmospheric parameters
+
+    Returns:
+        HTML document
+    """
+    if not data:
+        return "<p style='color: #888;'>Loading atmospheric data...</p>"
+
+    parts = ["<div style='background: #2a2a2a; padding: 10px;'>"]
+
+    if data.cape is not None:
+        cape_val, cape_interp = format_cape(data.cape)
+        color = _HIGH if data.cape > 2500 else _MID if data.cape > 1000 else _LOW
+        parts.append(f"<p><b style='color: #44aaff;'>⚡ CAPE:</b> <span style='color: {color};'>{cape_val}</span> <span style='color: #888;'>{cape_interp}</span></p>")
+
+    if data.cin is not None:
+        parts.append(f"<p><b style='color: #44aaff;'>🔒 CIN:</b> {data.cin:.0f} J/kg</p>")
+
+    if data.helicity is not None:
+        hel_val, hel_interp = format_helicity(data.helicity)
+        color = _HIGH if data.helicity > 300 else _MID if data.helicity > 150 else _LOW
+        parts.append(f"<p><b style='color: #44aaff;'>🌀 0-3km Helicity:</b> <span style='color: {color};'>{hel_val}</span> <span style='color: #888;'>{hel_interp}</span></p>")
+
+    if data.shear is not None:
+        color = _HIGH if data.shear > 40 else _MID if data.shear > 20 else _LOW
+        parts.append(f"<p><b style='color: #44aaff;'>💨 0-6km Shear:</b> <span style='color: {color};'>{data.shear:.0f} kts</span></p>")
+
+    if data.lifted_index is not None:
+        color = _HIGH if data.lifted_index < -4 else _MID if data.lifted_index < 0 else _LOW
+        parts.append(f"<p><b style='color: #44aaff;'>📊 Lifted Index:</b> <span style='color: {color};'>{data.lifted_index:.1f}</span></p>")
+
+    parts.append(f"<p style='color: #888; margin-top: 10px;'>🕐 Updated: {format_time_ago(data.timestamp)}</p>")
+    parts.append("</div>")
+
+    return "".join(parts)
 
 
 class AlertsPanel(QWidget):
@@ -75,6 +535,9 @@ class AlertsPanel(QWidget):
         super().__init__()
         self.init_ui()
         self.alerts = []
+        # alert id -> (rendered fields, HTML fragment) from the last update
+        self._fragments: Dict[str, tuple] = {}
+        self._html: Optional[str] = None
 
     def init_ui(self):
         """Initialize the UI."""
@@ -83,7 +546,7 @@ class AlertsPanel(QWidget):
         # Header
         header = QLabel("⚠️  ACTIVE WEATHER ALERTS")
         header.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        header.setStyleSheet("color: #ff4444; padding: 5px;")
+        header.setObjectName("alertsHeader")
         layout.addWidget(header)
 
         # Alerts text area
@@ -94,40 +557,23 @@ class AlertsPanel(QWidget):
 
         self.setLayout(layout)
 
-    def update_alerts(self, alerts: List[WeatherAlert]):
-        """Update alerts display."""
-        self.alerts = alerts
-
-        if not alerts:
-            self.alerts_text.setHtml("<p style='color: #888;'>No active alerts</p>")
-            return
-
-        html = ""
-        for alert in alerts:
-            severity = alert.severity.value.upper()
-            color = self._get_alert_color(severity)
-
-            html += f"""
-            <div style='border-left: 4px solid {color}; padding: 10px; margin: 10px 0; background: #2a2a2a;'>
-                <h3 style='color: {color}; margin: 0;'>{alert.event}</h3>
-                <p style='color: #aaa; margin: 5px 0;'>{', '.join(alert.areas[:3])}</p>
-                <p style='color: #fff; margin: 5px 0;'>{alert.description[:200]}...</p>
-                <p style='color: #ffa500; margin: 5px 0;'>Expires: {format_time_ago(alert.expires)}</p>
-            </div>
-            """
+    def update_alerts(self, alerts: List[WeatherAlert], html: Optional[str] = None):
+        """Update alerts display.
 
-        self.alerts_text.setHtml(html)
+        Args:
+            alerts: Active alerts
+            html: Document from format_alerts_html, if already built off the UI thread
+        """
+        self.alerts = alerts
+        if html is None:
+            html, self._fragments = format_alerts_html(alerts, self._fragments)
+        self._set_html(html)
 
-    def _get_alert_color(self, severity: str) -> str:
-        """Get color for alert severity."""
-        colors = {
-            "EXTREME": "#ff0066",
-            "SEVERE": "#ff4444",
-            "MODERATE": "#ff8800",
-            "MINOR": "#ffcc00",
-            "UNKNOWN": "#888888"
-        }
-        return colors.get(severity, "#888888")
+    def _set_html(self, html: str):
+        """Replace the document, skipping the reparse when nothing changed."""
+        if html != self._html:
+            self._html = html
+            self.alerts_text.setHtml(html)
 
 
 class CurrentWeatherPanel(QWidget):
@@ -136,6 +582,8 @@ class CurrentWeatherPanel(QWidget):
     def __init__(self):
         super().__init__()
         self.init_ui()
+        # Displayed inputs of the last update
+        self._signature: Optional[tuple] = None
 
     def init_ui(self):
         """Initialize the UI."""
@@ -144,11 +592,11 @@ class CurrentWeatherPanel(QWidget):
         # Header
         header = QLabel("🌡️  CURRENT CONDITIONS")
         header.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        header.setStyleSheet("color: #44aaff; padding: 5px;")
+        header.setObjectName("weatherHeader")
         layout.addWidget(header)
 
         self.location_label = QLabel("Location")
-        self.location_label.setStyleSheet("color: #888; font-size: 10pt;")
+        self.location_label.setObjectName("locationLabel")
         layout.addWidget(self.location_label)
 
         # Weather data grid
@@ -169,10 +617,10 @@ class CurrentWeatherPanel(QWidget):
         for key, label, row, col in fields:
             label_widget = QLabel(label)
             label_widget.setFont(QFont("Arial", 10, QFont.Weight.Bold))
-            label_widget.setStyleSheet("color: #44aaff;")
+            label_widget.setProperty("role", "field-name")
 
             value_widget = QLabel("--")
-            value_widget.setStyleSheet("color: #fff; font-size: 11pt;")
+            value_widget.setProperty("role", "field-value")
 
             self.weather_grid.addWidget(label_widget, row, col)
             self.weather_grid.addWidget(value_widget, row, col + 1)
@@ -185,6 +633,16 @@ class CurrentWeatherPanel(QWidget):
 
     def update_weather(self, weather: Optional[CurrentWeather], location_name: str):
         """Update weather display."""
+        signature = (location_name,) + ((
+            weather.temperature, weather.feels_like, weather.dewpoint,
+            weather.humidity, weather.pressure, weather.wind_speed,
+            weather.wind_direction, weather.wind_gust, weather.visibility,
+            weather.conditions
+        ) if weather else ())
+        if signature == self._signature:
+            return
+        self._signature = signature
+
         self.location_label.setText(location_name)
 
         if not weather:
@@ -202,6 +660,50 @@ class CurrentWeatherPanel(QWidget):
         self.weather_labels["conditions"].setText(weather.conditions)
 
 
+_LEGEND_HTML = """
+<div style='color: #ffffff;'>
+<b>REFLECTIVITY SCALE (dBZ):</b><br>
+<span style='color: #4444ff;'>15-25: Light</span> |
+<span style='color: #44ff44;'>25-35: Moderate</span> |
+<span style='color: #ffff44;'>35-45: Heavy</span> |
+<span style='color: #ff8844;'>45-55: Very Heavy</span> |
+<span style='color: #ff4444;'>55-65: Extreme</span> |
+<span style='color: #ff00ff;'>65+: Giant Hail</span>
+</div>
+"""
+_LEGEND_WIDTH = 420
+_LEGEND_PIXMAP: Optional[QPixmap] = None
+
+
+def _legend_pixmap(font: QFont, pixel_ratio: float) -> QPixmap:
+    """Render the static dBZ legend once and reuse the image afterwards.
+
+    Args:
+        font: Font to lay the legend out in
+        pixel_ratio: Device pixel ratio of the screen it is shown on
+
+    Returns:
+        Pixmap of the legend
+    """
+    global _LEGEND_PIXMAP
+    if _LEGEND_PIXMAP is None:
+        doc = QTextDocument()
+        doc.setDefaultFont(font)
+        doc.setDocumentMargin(10)
+        doc.setHtml(_LEGEND_HTML)
+        doc.setTextWidth(_LEGEND_WIDTH)
+
+        size = doc.size().toSize()
+        pixmap = QPixmap(size * pixel_ratio)
+        pixmap.setDevicePixelRatio(pixel_ratio)
+        pixmap.fill(QColor("#2a2a2a"))
+        painter = QPainter(pixmap)
+        doc.drawContents(painter)
+        painter.end()
+        _LEGEND_PIXMAP = pixmap
+    return _LEGEND_PIXMAP
+
+
 class RadarPanel(QWidget):
     """Panel for radar display."""
 
@@ -216,33 +718,23 @@ class RadarPanel(QWidget):
         # Header
         header = QLabel("📡 NEXRAD RADAR")
         header.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        header.setStyleSheet("color: #44ff44; padding: 5px;")
+        header.setObjectName("radarHeader")
         layout.addWidget(header)
 
         self.station_label = QLabel("Station: --")
-        self.station_label.setStyleSheet("color: #aaa;")
+        self.station_label.setObjectName("stationLabel")
         layout.addWidget(self.station_label)
 
         # Radar display area
         self.radar_text = QTextEdit()
         self.radar_text.setReadOnly(True)
         self.radar_text.setFont(QFont("Consolas", 8))
-        self.radar_text.setStyleSheet("background: #000; color: #0f0;")
+        self.radar_text.setObjectName("radarText")
         layout.addWidget(self.radar_text)
 
         # Legend
-        legend = QLabel("""
-        <div style='background: #2a2a2a; padding: 10px;'>
-        <b>REFLECTIVITY SCALE (dBZ):</b><br>
-        <span style='color: #4444ff;'>15-25: Light</span> |
-        <span style='color: #44ff44;'>25-35: Moderate</span> |
-        <span style='color: #ffff44;'>35-45: Heavy</span> |
-        <span style='color: #ff8844;'>45-55: Very Heavy</span> |
-        <span style='color: #ff4444;'>55-65: Extreme</span> |
-        <span style='color: #ff00ff;'>65+: Giant Hail</span>
-        </div>
-        """)
-        legend.setWordWrap(True)
+        legend = QLabel()
+        legend.setPixmap(_legend_pixmap(legend.font(), legend.devicePixelRatioF()))
         layout.addWidget(legend)
 
         self.setLayout(layout)
@@ -259,11 +751,51 @@ class RadarPanel(QWidget):
         self.radar_text.setPlainText(f"Radar data loaded for {station}\nTimestamp: {radar_data.timestamp}\nProduct: {radar_data.product_type}")
 
 
+class StormCellRow(QFrame):
+    """One storm cell in the storm cells panel.
+
+    Rows are pooled by the panel and refilled in place, so a refresh only
+    changes label text instead of building a new document.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.setObjectName("cellRow")
+        self._content: Optional[Tuple[str, str, str]] = None
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(10, 10, 10, 10)
+        self.title_label = QLabel()
+        self.details_label = QLabel()
+        for label in (self.title_label, self.details_label):
+            label.setTextFormat(Qt.TextFormat.RichText)
+            label.setWordWrap(True)
+            layout.addWidget(label)
+        self.setLayout(layout)
+
+    def set_content(self, color: str, title: str, details: str):
+        """Show a row from format_cell_rows, touching only what changed."""
+        previous = self._content or ("", "", "")
+        self._content = (color, title, details)
+        if color != previous[0]:
+            self.setStyleSheet(
+                f"QFrame#cellRow {{ border: 2px solid {color}; background: #2a2a2a; }}"
+            )
+        if title != previous[1]:
+            self.title_label.setText(title)
+        if details != previous[2]:
+            self.details_label.setText(details)
+
+
 class StormCellsPanel(QWidget):
     """Panel for storm cell tracking."""
 
     def __init__(self):
         super().__init__()
+        # Rows created so far; the ones past the current cell count are hidden
+        self._row_pool: List[StormCellRow] = []
+        # Displayed inputs of the last update
+        self._signature: Optional[tuple] = None
         self.init_ui()
 
     def init_ui(self):
@@ -273,57 +805,68 @@ class StormCellsPanel(QWidget):
         # Header
         header = QLabel("⛈️  STORM CELLS")
         header.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        header.setStyleSheet("color: #ffff44; padding: 5px;")
+        header.setObjectName("cellsHeader")
         layout.addWidget(header)
 
-        # Storm cells text area
-        self.cells_text = QTextEdit()
-        self.cells_text.setReadOnly(True)
-        self.cells_text.setFont(QFont("Consolas", 10))
-        layout.addWidget(self.cells_text)
+        # Storm cell rows
+        container = QWidget()
+        container.setFont(QFont("Consolas", 10))
+        self.rows_layout = QVBoxLayout(container)
+        self.empty_label = QLabel("No storm cells detected")
+        self.empty_label.setProperty("role", "placeholder")
+        self.rows_layout.addWidget(self.empty_label)
+        self.rows_layout.addStretch()
+
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setWidget(container)
+        layout.addWidget(scroll)
 
         self.setLayout(layout)
 
-    def update_cells(self, cells: List[StormCell], location: tuple):
-        """Update storm cells display."""
-        if not cells:
-            self.cells_text.setHtml("<p style='color: #888;'>No storm cells detected</p>")
+    def update_cells(
+        self,
+        cells: StormCellTable,
+        location: tuple,
+        rows: Optional[List[Tuple[str, str, str]]] = None
+    ):
+        """Update storm cells display.
+
+        Args:
+            cells: Detected storm cells
+            location: (latitude, longitude) distances and bearings are measured from
+            rows: Output of format_cell_rows, if already built off the UI thread
+        """
+        signature = (location,) + tuple(
+            (cell.intensity, round(cell.latitude, 3), round(cell.longitude, 3),
+             cell.movement_direction, cell.movement_speed, cell.has_rotation,
+             cell.rotation_strength, cell.tvs, cell.meso, cell.max_hail_size,
+             cell.top_height)
+            for cell in cells
+        )
+        if signature == self._signature:
             return
+        self._signature = signature
 
-        lat, lon = location
-        html = ""
-
-        for i, cell in enumerate(cells, 1):
-            dist = calculate_distance(lat, lon, cell.latitude, cell.longitude)
-            bearing = calculate_bearing(lat, lon, cell.latitude, cell.longitude)
-            bearing_str = format_bearing(bearing)
-
-            intensity_color = "#ff4444" if cell.intensity > 60 else "#ffff44" if cell.intensity > 50 else "#44ff44"
-
-            warnings = ""
-            if cell.tvs:
-                warnings += "<span style='color: #ff0066; font-weight: bold;'>[TVS]</span> "
-            if cell.meso:
-                warnings += "<span style='color: #ff4444; font-weight: bold;'>[MESO]</span> "
-            if cell.max_hail_size and cell.max_hail_size > 1.0:
-                warnings += f"<span style='color: #ff00ff; font-weight: bold;'>[HAIL {cell.max_hail_size}\"]</span> "
-
-            html += f"""
-            <div style='border: 2px solid {intensity_color}; padding: 10px; margin: 10px 0; background: #2a2a2a;'>
-                <h3 style='color: {intensity_color}; margin: 0;'>CELL {i}: {cell.intensity} dBZ {warnings}</h3>
-                <p style='margin: 5px 0;'>📍 Location: {format_distance(dist)} {bearing_str} ({bearing}°)</p>
-                <p style='margin: 5px 0;'>🎯 Coordinates: {cell.latitude:.3f}°N, {cell.longitude:.3f}°W</p>
-                <p style='margin: 5px 0;'>➡️  Movement: {format_bearing(cell.movement_direction)} @ {cell.movement_speed:.0f} mph</p>
-            """
+        if rows is None:
+            rows = format_cell_rows(cells, location)
+        self._set_rows(rows)
 
-            if cell.has_rotation:
-                html += f"<p style='color: #ff4444; margin: 5px 0;'>🌪️  Rotation: {cell.rotation_strength:.4f}</p>"
-            if cell.top_height:
-                html += f"<p style='color: #44aaff; margin: 5px 0;'>⬆️  Top: {cell.top_height:,} ft</p>"
+    def _set_rows(self, rows: List[Tuple[str, str, str]]):
+        """Fill pooled rows, creating more only when there are more cells than ever before."""
+        while len(self._row_pool) < len(rows):
+            row = StormCellRow()
+            # Keep the trailing stretch last
+            self.rows_layout.insertWidget(self.rows_layout.count() - 1, row)
+            self._row_pool.append(row)
 
-            html += "</div>"
+        for row, content in zip(self._row_pool, rows):
+            row.set_content(*content)
+            row.setVisible(True)
+        for row in self._row_pool[len(rows):]:
+            row.setVisible(False)
 
-        self.cells_text.setHtml(html)
+        self.empty_label.setVisible(not rows)
 
 
 class AtmosphericPanel(QWidget):
@@ -332,6 +875,7 @@ class AtmosphericPanel(QWidget):
     def __init__(self):
         super().__init__()
         self.init_ui()
+        self._html: Optional[str] = None
 
     def init_ui(self):
         """Initialize the UI."""
@@ -340,7 +884,7 @@ class AtmosphericPanel(QWidget):
         # Header
         header = QLabel("📊 ATMOSPHERIC DATA")
         header.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        header.setStyleSheet("color: #ff44ff; padding: 5px;")
+        header.setObjectName("atmosphericHeader")
         layout.addWidget(header)
 
         # Parameters grid
@@ -351,39 +895,20 @@ class AtmosphericPanel(QWidget):
 
         self.setLayout(layout)
 
-    def update_atmospheric(self, data: Optional[AtmosphericData]):
-        """Update atmospheric data display."""
-        if not data:
-            self.params_text.setHtml("<p style='color: #888;'>Loading atmospheric data...</p>")
-            return
-
-        html = "<div style='background: #2a2a2a; padding: 10px;'>"
-
-        if data.cape is not None:
-            cape_val, cape_interp = format_cape(data.cape)
-            color = "#ff4444" if data.cape > 2500 else "#ffff44" if data.cape > 1000 else "#44ff44"
-            html += f"<p><b style='color: #44aaff;'>⚡ CAPE:</b> <span style='color: {color};'>{cape_val}</span> <span style='color: #888;'>{cape_interp}</span></p>"
-
-        if data.cin is not None:
-            html += f"<p><b style='color: #44aaff;'>🔒 CIN:</b> {data.cin:.0f} J/kg</p>"
-
-        if data.helicity is not None:
-            hel_val, hel_interp = format_helicity(data.helicity)
-            color = "#ff4444" if data.helicity > 300 else "#ffff44" if data.helicity > 150 else "#44ff44"
-            html += f"<p><b style='color: #44aaff;'>🌀 0-3km Helicity:</b> <span style='color: {color};'>{hel_val}</span> <span style='color: #888;'>{hel_interp}</span></p>"
+    def update_atmospheric(self, data: Optional[AtmosphericData], html: Optional[str] = None):
+        """Update atmospheric data display.
 
-        if data.shear is not None:
-            color = "#ff4444" if data.shear > 40 else "#ffff44" if data.shear > 20 else "#44ff44"
-            html += f"<p><b style='color: #44aaff;'>💨 0-6km Shear:</b> <span style='color: {color};'>{data.shear:.0f} kts</span></p>"
-
-        if data.lifted_index is not None:
-            color = "#ff4444" if data.lifted_index < -4 else "#ffff44" if data.lifted_index < 0 else "#44ff44"
-            html += f"<p><b style='color: #44aaff;'>📊 Lifted Index:</b> <span style='color: {color};'>{data.lifted_index:.1f}</span></p>"
-
-        html += f"<p style='color: #888; margin-top: 10px;'>🕐 Updated: {format_time_ago(data.timestamp)}</p>"
-        html += "</div>"
-
-        self.params_text.setHtml(html)
+        Args:
+            data: Atmospheric parameters
+            html: Document from format_atmospheric_html, if already built off the UI thread
+        """
+        if html is None:
+            html = format_atmospheric_html(data)
+        # The "Updated" line makes a field signature change every fetch, so
+        # compare the document instead
+        if html != self._html:
+            self._html = html
+            self.params_text.setHtml(html)
 
 
 class WXNETMainWindow(QMainWindow):
@@ -401,24 +926,43 @@ class WXNETMainWindow(QMainWindow):
             name=config.default_location
         )
 
-        # Initialize API clients
-        self.nws_client = NWSClient()
-        self.nexrad_client = NEXRADClient()
-        self.spc_client = SPCProductsClient()
-        self.lightning_client = LightningClient()
-        self.meso_client = MesoanalysisClient()
+        # All fetches run on one background event loop
+        self.worker = AsyncWorker()
+        self.worker.start()
+
+        # Initialize API clients on one HTTP session, opened on the worker
+        # loop, so they reuse connections across sources and refreshes
+        self.http = self.worker.run_blocking(self._open_session())
+        self.nws_client = NWSClient(session=self.http)
+        self.nexrad_client = NEXRADClient(session=self.http)
+        self.meso_client = MesoanalysisClient(session=self.http)
+        # Clients only the SPC and lightning tabs need are created (and
+        # their modules imported) on first use
+        self._spc_client = None
+        self._lightning_client = None
 
         # Initialize utilities
         self.gps_tracker = GPSTracker()
         self.sound_alerts = SoundAlerts()
-        self.chase_logger = ChaseLogger()
+        self.chase_logger = create_chase_logger()
 
         # Data storage
         self.alerts = []
         self.current_weather = None
         self.radar_data = None
-        self.storm_cells = []
+        # ((rounded lat, rounded lon), nearest station) from the last lookup
+        self._station_cache: Optional[Tuple[Tuple[float, float], str]] = None
+        self.storm_cells = StormCellTable.from_cells([])
         self.atmospheric_data = None
+        # Alert fragments from the last format_alerts_html call; only the
+        # worker loop touches this
+        self._alert_fragments: Dict[str, tuple] = {}
+        # time.monotonic() of the last manual refresh
+        self._last_manual_refresh: Optional[float] = None
+
+        # Panel writes are applied once per frame, and held while the
+        # overview they draw into can't be seen
+        self.batcher = RenderBatcher(self, can_flush=self._overview_visible)
 
         # Setup UI
         self.init_ui()
@@ -441,8 +985,8 @@ class WXNETMainWindow(QMainWindow):
         self.tabs.setFont(QFont("Arial", 11))
 
         # Overview Tab
-        overview_tab = self.create_overview_tab()
-        self.tabs.addTab(overview_tab, "Overview")
+        self.overview_tab = self.create_overview_tab()
+        self.tabs.addTab(self.overview_tab, "Overview")
 
         # SPC Products Tab
         spc_tab = self.create_spc_tab()
@@ -457,6 +1001,7 @@ class WXNETMainWindow(QMainWindow):
         self.tabs.addTab(gps_tab, "GPS/Chase")
 
         main_layout.addWidget(self.tabs)
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
         # Status bar
         self.status_bar = QStatusBar()
@@ -516,7 +1061,7 @@ class WXNETMainWindow(QMainWindow):
 
         header = QLabel("⚠️  STORM PREDICTION CENTER PRODUCTS")
         header.setFont(QFont("Arial", 16, QFont.Weight.Bold))
-        header.setStyleSheet("color: #ffff44; padding: 10px;")
+        header.setObjectName("spcHeader")
         layout.addWidget(header)
 
         self.spc_text = QTextEdit()
@@ -534,7 +1079,7 @@ class WXNETMainWindow(QMainWindow):
 
         header = QLabel("⚡ LIGHTNING DETECTION & ANALYSIS")
         header.setFont(QFont("Arial", 16, QFont.Weight.Bold))
-        header.setStyleSheet("color: #ffff44; padding: 10px;")
+        header.setObjectName("lightningHeader")
         layout.addWidget(header)
 
         self.lightning_text = QTextEdit()
@@ -552,7 +1097,7 @@ class WXNETMainWindow(QMainWindow):
 
         header = QLabel("📍 GPS TRACKING & CHASE MANAGEMENT")
         header.setFont(QFont("Arial", 16, QFont.Weight.Bold))
-        header.setStyleSheet("color: #44ff44; padding: 10px;")
+        header.setObjectName("gpsHeader")
         layout.addWidget(header)
 
         self.gps_text = QTextEdit()
@@ -572,7 +1117,7 @@ class WXNETMainWindow(QMainWindow):
 
         refresh_action = QAction("Refresh All", self)
         refresh_action.setShortcut("F5")
-        refresh_action.triggered.connect(self.refresh_all_data)
+        refresh_action.triggered.connect(self.manual_refresh)
         file_menu.addAction(refresh_action)
 
         file_menu.addSeparator()
@@ -604,7 +1149,7 @@ class WXNETMainWindow(QMainWindow):
 
         # Refresh button
         refresh_btn = QPushButton("🔄 Refresh")
-        refresh_btn.clicked.connect(self.refresh_all_data)
+        refresh_btn.clicked.connect(self.manual_refresh)
         toolbar.addWidget(refresh_btn)
 
         toolbar.addSeparator()
@@ -615,131 +1160,293 @@ class WXNETMainWindow(QMainWindow):
         toolbar.addWidget(self.sound_btn)
 
     def setup_timers(self):
-        """Setup auto-refresh timers."""
-        # Alerts timer
-        self.alerts_timer = QTimer()
-        self.alerts_timer.timeout.connect(self.refresh_alerts)
-        self.alerts_timer.start(config.alert_update_interval * 1000)
-
-        # Weather timer
-        self.weather_timer = QTimer()
-        self.weather_timer.timeout.connect(self.refresh_weather)
-        self.weather_timer.start(config.weather_update_interval * 1000)
-
-        # Radar timer
-        self.radar_timer = QTimer()
-        self.radar_timer.timeout.connect(self.refresh_radar)
-        self.radar_timer.start(config.radar_update_interval * 1000)
+        """Setup auto-refresh schedules on the worker loop."""
+        self._poll_callbacks = {
+            "alerts": self.refresh_alerts,
+            "weather": self.refresh_weather,
+            "radar": self.refresh_radar,
+        }
+        # Configured intervals, which adaptive polling returns to
+        self._base_intervals = {
+            "alerts": config.alert_update_interval * 1000,
+            "weather": config.weather_update_interval * 1000,
+            "radar": config.radar_update_interval * 1000,
+        }
+        # Current interval of each schedule
+        self._intervals: Dict[str, int] = {}
+        for name, base in self._base_intervals.items():
+            self._set_interval(name, base)
+
+        self._last_signature = None
+        self._stable_rounds = 0
+
+    def _set_interval(self, name: str, interval_ms: int):
+        """Change a schedule's interval; rescheduling restarts it, so only on change."""
+        if self._intervals.get(name) != interval_ms:
+            self._intervals[name] = interval_ms
+            self.worker.every(name, interval_ms, self._poll_callbacks[name])
+
+    def _adapt_intervals(self):
+        """Retune the refresh schedules to how active the weather is.
+
+        Called after each alerts refresh. Severe/extreme alerts or strong cells
+        poll alerts and radar fast; a run of unchanged refreshes backs weather
+        and radar off. Alerts never poll slower than configured.
+        """
+        intensities = self.storm_cells.intensities
+        signature = hash((
+            tuple(alert.id for alert in self.alerts),
+            tuple(intensities.tolist())
+        ))
+        active = (
+            any(alert.severity in _ACTIVE_SEVERITIES for alert in self.alerts)
+            or (len(intensities) > 0 and int(intensities.max()) > _ACTIVE_CELL_DBZ)
+        )
+
+        if active:
+            self._stable_rounds = 0
+            for name in ("alerts", "radar"):
+                self._set_interval(name, min(self._base_intervals[name], _ACTIVE_INTERVAL_MS))
+            self._set_interval("weather", self._base_intervals["weather"])
+        elif signature != self._last_signature:
+            # Something changed: back to the configured intervals
+            self._stable_rounds = 0
+            for name, base in self._base_intervals.items():
+                self._set_interval(name, base)
+        else:
+            self._stable_rounds += 1
+            if self._stable_rounds >= _STABLE_ROUNDS:
+                # Hysteresis: double at most once per _STABLE_ROUNDS stable rounds
+                self._stable_rounds = 0
+                for name in ("weather", "radar"):
+                    cap = max(self._base_intervals[name], _MAX_INTERVAL_MS)
+                    self._set_interval(name, min(self._intervals[name] * 2, cap))
+            self._set_interval("alerts", self._base_intervals["alerts"])
+
+        self._last_signature = signature
+
+    def manual_refresh(self):
+        """Refresh all data on request, at most once per _MANUAL_REFRESH_GAP_S.
+
+        The polling schedules keep the panels current; this only throttles
+        repeated F5 presses and button clicks so they can't pile fetches
+        onto the rate-limited NWS and SPC endpoints.
+        """
+        now = time.monotonic()
+        if (self._last_manual_refresh is not None
+                and now - self._last_manual_refresh < _MANUAL_REFRESH_GAP_S):
+            self.status_label.setText(f"Refresh throttled ({_MANUAL_REFRESH_GAP_S // 60} min)")
+            return
+
+        self._last_manual_refresh = now
+        self.refresh_all_data()
 
     def refresh_all_data(self):
         """Refresh all weather data."""
         self.status_label.setText("Refreshing all data...")
-        self.refresh_alerts()
-        self.refresh_weather()
-        self.refresh_radar()
-        self.refresh_atmospheric()
-        self.status_label.setText(f"Last updated: {datetime.now().strftime('%H:%M:%S')}")
+        lat, lon = self.location.latitude, self.location.longitude
+        station = self._nearest_station()
+        self.worker.submit(
+            "all",
+            self._refresh_all(lat, lon, station),
+            lambda results: self.on_all_ready(results, station, (lat, lon))
+        )
+
+    async def _refresh_all(self, lat: float, lon: float, station: str) -> tuple:
+        """Run every fetch concurrently on the worker loop.
+
+        Storm cell detection waits for the radar data it works from.
+
+        Returns:
+            Tuple of (alerts, weather, radar, atmospheric, cells) results in
+            the shapes the matching on_*_ready handlers take; any entry may
+            be the exception that fetch raised
+        """
+        alerts, weather, radar, atmospheric = await asyncio.gather(
+            self._fetch_alerts(lat, lon),
+            self.nws_client.get_observation(lat, lon),
+            self.nexrad_client.get_reflectivity_data(station, lat, lon),
+            self._fetch_atmospheric(lat, lon),
+            return_exceptions=True
+        )
+
+        cells = None
+        if radar and not isinstance(radar, BaseException):
+            try:
+                cells = await self._detect_cells(radar, (lat, lon))
+            except Exception as e:
+                cells = e
+
+        return alerts, weather, radar, atmospheric, cells
+
+    def on_all_ready(self, results: tuple, station: str, location: tuple):
+        """Handle a full refresh, showing every panel in the same frame."""
+        alerts, weather, radar, atmospheric, cells = results
+        updates = [
+            ("alerts", self.on_alerts_ready, alerts),
+            ("weather", self.on_weather_ready, weather),
+            ("radar", lambda data: self._show_radar(data, station), radar),
+            ("atmospheric", self.on_atmospheric_ready, atmospheric),
+        ]
+        # Without radar data there was nothing to detect cells in
+        if cells is not None:
+            updates.append(("cells", lambda result: self.on_cells_ready(result, location), cells))
+
+        for data_type, handler, result in updates:
+            if isinstance(result, BaseException):
+                self.worker.error_occurred.emit(data_type, str(result))
+            else:
+                handler(result)
+
+        self.batcher.force_flush()
+        self.status_label.setText(f"Last updated: {_clock_text(int(time.time()))}")
 
     def refresh_alerts(self):
         """Refresh weather alerts."""
-        thread = DataFetchThread(
+        self.worker.submit(
             "alerts",
-            self.nws_client.get_alerts,
-            self.location.latitude,
-            self.location.longitude
+            self._fetch_alerts(self.location.latitude, self.location.longitude),
+            self.on_alerts_ready
         )
-        thread.data_ready.connect(self.on_alerts_ready)
-        thread.start()
-        self._alerts_thread = thread  # Keep reference
 
-    def on_alerts_ready(self, data_type: str, alerts: List[WeatherAlert]):
+    async def _fetch_alerts(self, lat: float, lon: float) -> Tuple[List[WeatherAlert], str]:
+        """Fetch alerts and build their HTML on the worker loop."""
+        alerts = await self.nws_client.get_alerts(lat, lon)
+        html, self._alert_fragments = format_alerts_html(alerts, self._alert_fragments)
+        return alerts, html
+
+    def on_alerts_ready(self, result: Tuple[List[WeatherAlert], str]):
         """Handle alerts data ready."""
+        alerts, html = result
         self.alerts = alerts
-        self.alerts_panel.update_alerts(alerts)
+        self.batcher.submit("alerts", lambda: self.alerts_panel.update_alerts(alerts, html))
 
-        # Check for tornado warnings
+        # Check for tornado warnings; those are shown right away
         for alert in alerts:
-            if "Tornado Warning" in alert.event and self.sound_alerts.enabled:
-                self.sound_alerts.play_tornado_warning()
+            if "Tornado Warning" in alert.event:
+                self.batcher.force_flush()
+                if self.sound_alerts.enabled:
+                    self.sound_alerts.play_tornado_warning()
                 break
 
+        self._adapt_intervals()
+
     def refresh_weather(self):
         """Refresh current weather."""
-        thread = DataFetchThread(
+        self.worker.submit(
             "weather",
-            self.nws_client.get_observation,
-            self.location.latitude,
-            self.location.longitude
+            self.nws_client.get_observation(self.location.latitude, self.location.longitude),
+            self.on_weather_ready
         )
-        thread.data_ready.connect(self.on_weather_ready)
-        thread.start()
-        self._weather_thread = thread
 
-    def on_weather_ready(self, data_type: str, weather: Optional[CurrentWeather]):
+    def on_weather_ready(self, weather: Optional[CurrentWeather]):
         """Handle weather data ready."""
         self.current_weather = weather
-        self.weather_panel.update_weather(weather, self.location.name)
+        location_name = self.location.name
+        self.batcher.submit("weather", lambda: self.weather_panel.update_weather(weather, location_name))
 
     def refresh_radar(self):
         """Refresh radar data."""
-        # Find nearest station
-        stations = self.nexrad_client.find_nearest_stations(
-            self.location.latitude,
-            self.location.longitude,
-            count=1
-        )
-        station = stations[0][0] if stations else "KTLX"
-
-        thread = DataFetchThread(
+        station = self._nearest_station()
+        self.worker.submit(
             "radar",
-            self.nexrad_client.get_reflectivity_data,
-            station,
-            self.location.latitude,
-            self.location.longitude,
-            radius_km=300
+            self.nexrad_client.get_reflectivity_data(
+                station,
+                self.location.latitude,
+                self.location.longitude
+            ),
+            lambda data: self.on_radar_ready(data, station)
         )
-        thread.data_ready.connect(lambda dt, data: self.on_radar_ready(dt, data, station))
-        thread.start()
-        self._radar_thread = thread
 
-    def on_radar_ready(self, data_type: str, radar_data, station: str):
-        """Handle radar data ready."""
+    def _nearest_station(self) -> str:
+        """Nearest radar station to the current location.
+
+        The last answer is reused until we've moved roughly a kilometer.
+        """
+        station_key = (round(self.location.latitude, 2), round(self.location.longitude, 2))
+        if self._station_cache and self._station_cache[0] == station_key:
+            station = self._station_cache[1]
+        else:
+            stations = self.nexrad_client.find_nearest_stations(
+                self.location.latitude,
+                self.location.longitude,
+                count=1
+            )
+            station = stations[0][0] if stations else "KTLX"
+            self._station_cache = (station_key, station)
+        return station
+
+    def _show_radar(self, radar_data, station: str):
+        """Store radar data and queue the panel update."""
         self.radar_data = radar_data
-        self.radar_panel.update_radar(radar_data, station)
+        self.batcher.submit("radar", lambda: self.radar_panel.update_radar(radar_data, station))
+
+    def on_radar_ready(self, radar_data, station: str):
+        """Handle radar data ready."""
+        self._show_radar(radar_data, station)
 
         # Detect storm cells
         if radar_data:
-            thread = DataFetchThread(
+            location = (self.location.latitude, self.location.longitude)
+            self.worker.submit(
                 "cells",
-                self.nexrad_client.detect_storm_cells,
-                radar_data,
-                threshold_dbz=40
+                self._detect_cells(radar_data, location),
+                lambda result: self.on_cells_ready(result, location)
             )
-            thread.data_ready.connect(self.on_cells_ready)
-            thread.start()
-            self._cells_thread = thread
 
-    def on_cells_ready(self, data_type: str, cells: List[StormCell]):
+    async def _detect_cells(self, radar_data, location: tuple) -> Tuple[StormCellTable, list]:
+        """Detect storm cells and build their panel rows on an executor thread.
+
+        Detection is CPU-bound; running it off the worker loop keeps the
+        other fetches moving meanwhile.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._detect_cells_sync, radar_data, location)
+
+    def _detect_cells_sync(self, radar_data, location: tuple) -> Tuple[StormCellTable, list]:
+        """Blocking half of _detect_cells."""
+        cells = self.nexrad_client.detect_storm_cells_sync(radar_data, 40)
+        return cells, format_cell_rows(cells, location)
+
+    def on_cells_ready(self, result: Tuple[StormCellTable, list], location: tuple):
         """Handle storm cells data ready."""
+        cells, rows = result
         self.storm_cells = cells
-        self.cells_panel.update_cells(cells, (self.location.latitude, self.location.longitude))
+        self.batcher.submit("cells", lambda: self.cells_panel.update_cells(cells, location, rows))
 
     def refresh_atmospheric(self):
         """Refresh atmospheric data."""
-        thread = DataFetchThread(
+        self.worker.submit(
             "atmospheric",
-            self.meso_client.get_atmospheric_parameters,
-            self.location.latitude,
-            self.location.longitude
+            self._fetch_atmospheric(self.location.latitude, self.location.longitude),
+            self.on_atmospheric_ready
         )
-        thread.data_ready.connect(self.on_atmospheric_ready)
-        thread.start()
-        self._atmos_thread = thread
 
-    def on_atmospheric_ready(self, data_type: str, data: Optional[AtmosphericData]):
+    async def _fetch_atmospheric(self, lat: float, lon: float) -> Tuple[Optional[AtmosphericData], str]:
+        """Fetch atmospheric parameters and build their HTML on the worker loop."""
+        data = await self.meso_client.get_atmospheric_parameters(lat, lon)
+        return data, format_atmospheric_html(data)
+
+    def on_atmospheric_ready(self, result: Tuple[Optional[AtmosphericData], str]):
         """Handle atmospheric data ready."""
+        data, html = result
         self.atmospheric_data = data
-        self.atmospheric_panel.update_atmospheric(data)
+        self.batcher.submit("atmospheric", lambda: self.atmospheric_panel.update_atmospheric(data, html))
+
+    def _overview_visible(self) -> bool:
+        """Whether the overview panels can currently be seen."""
+        return not self.isMinimized() and self.tabs.currentWidget() is self.overview_tab
+
+    def _on_tab_changed(self, index: int):
+        """Apply updates held while the overview was hidden."""
+        if self._overview_visible():
+            self.batcher.force_flush()
+
+    def changeEvent(self, event):
+        """Apply held updates when the window is restored."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange and self._overview_visible():
+            self.batcher.force_flush()
 
     def toggle_sound(self):
         """Toggle sound alerts."""
@@ -769,100 +1476,34 @@ class WXNETMainWindow(QMainWindow):
 
     def apply_dark_theme(self):
         """Apply dark theme to application."""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #1a1a1a;
-            }
-            QWidget {
-                background-color: #1a1a1a;
-                color: #ffffff;
-            }
-            QTextEdit {
-                background-color: #2a2a2a;
-                color: #ffffff;
-                border: 1px solid #444;
-                border-radius: 5px;
-                padding: 5px;
-            }
-            QTabWidget::pane {
-                border: 1px solid #444;
-                background-color: #1a1a1a;
-            }
-            QTabBar::tab {
-                background-color: #2a2a2a;
-                color: #ffffff;
-                padding: 10px 20px;
-                margin: 2px;
-                border: 1px solid #444;
-                border-radius: 5px 5px 0 0;
-            }
-            QTabBar::tab:selected {
-                background-color: #3a3a3a;
-                border-bottom: 2px solid #44aaff;
-            }
-            QPushButton {
-                background-color: #3a3a3a;
-                color: #ffffff;
-                border: 1px solid #555;
-                border-radius: 5px;
-                padding: 8px 15px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #4a4a4a;
-                border: 1px solid #44aaff;
-            }
-            QPushButton:pressed {
-                background-color: #2a2a2a;
-            }
-            QMenuBar {
-                background-color: #2a2a2a;
-                color: #ffffff;
-            }
-            QMenuBar::item:selected {
-                background-color: #3a3a3a;
-            }
-            QMenu {
-                background-color: #2a2a2a;
-                color: #ffffff;
-                border: 1px solid #444;
-            }
-            QMenu::item:selected {
-                background-color: #44aaff;
-            }
-            QToolBar {
-                background-color: #2a2a2a;
-                border: 1px solid #444;
-                spacing: 5px;
-                padding: 5px;
-            }
-            QStatusBar {
-                background-color: #2a2a2a;
-                color: #aaa;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-        """)
+        app = QApplication.instance()
+        if app.styleSheet() != DARK_QSS:
+            app.setStyleSheet(DARK_QSS)
+
+    @property
+    def spc_client(self):
+        """SPC products client, created on first use."""
+        if self._spc_client is None:
+            from .api.spc import SPCProductsClient
+            self._spc_client = SPCProductsClient(session=self.http)
+        return self._spc_client
+
+    @property
+    def lightning_client(self):
+        """Lightning client, created on first use."""
+        if self._lightning_client is None:
+            from .api.lightning import LightningClient
+            self._lightning_client = LightningClient(session=self.http)
+        return self._lightning_client
+
+    async def _open_session(self) -> aiohttp.ClientSession:
+        """Create the shared HTTP session on the worker loop."""
+        return create_session()
 
     def closeEvent(self, event):
         """Handle window close event."""
-        # Close all HTTP sessions
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        if self.nws_client and self.nws_client.session:
-            loop.run_until_complete(self.nws_client.session.close())
-        if self.nexrad_client and self.nexrad_client.session:
-            loop.run_until_complete(self.nexrad_client.session.close())
-        if self.spc_client and self.spc_client.session:
-            loop.run_until_complete(self.spc_client.session.close())
-        if self.lightning_client and self.lightning_client.session:
-            loop.run_until_complete(self.lightning_client.session.close())
-        if self.meso_client and self.meso_client.session:
-            loop.run_until_complete(self.meso_client.session.close())
-
-        loop.close()
+        # Close the HTTP session on the loop it was opened on as it stops
+        self.worker.stop(self.http.close())
 
         # Stop GPS tracking
         if self.gps_tracker:
@@ -876,6 +1517,7 @@ def main():
     app = QApplication(sys.argv)
     app.setApplicationName("WXNET")
     app.setOrganizationName("WXNET")
+    app.setStyleSheet(DARK_QSS)
 
     window = WXNETMainWindow()
     window.show()
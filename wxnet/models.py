@@ -1,8 +1,10 @@
 """Data models for WXNET."""
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 from enum import Enum
+import numpy as np
 from pydantic import BaseModel, Field
 
 
@@ -53,6 +55,9 @@ class WeatherAlert(BaseModel):
     sender_name: Optional[str] = None
     areas: List[str] = Field(default_factory=list)
 
+    # Display-ready description, filled in at ingest time
+    _short_desc: str = ""
+
 
 class CurrentWeather(BaseModel):
     """Current weather conditions."""
@@ -69,7 +74,13 @@ class CurrentWeather(BaseModel):
     conditions: str
     timestamp: datetime
 
+    # Observation time as epoch seconds, filled in at ingest time
+    _epoch: int = 0
+
 
+# Models are always built through validation, even from values we generated
+# ourselves: pydantic 2's compiled validator constructs these small models
+# faster than model_construct, which runs in Python
 class StormCell(BaseModel):
     """Individual storm cell data."""
     id: str
@@ -88,6 +99,54 @@ class StormCell(BaseModel):
     timestamp: datetime
 
 
+@dataclass(eq=False)
+class StormCellTable:
+    """Detected storm cells with their numeric fields as NumPy columns.
+
+    The columns let display code compute distances and colors for all cells
+    at once; iterating or indexing yields the StormCell rows.
+    """
+    cells: List[StormCell]
+    lats: np.ndarray
+    lons: np.ndarray
+    intensities: np.ndarray
+    movement_directions: np.ndarray
+    movement_speeds: np.ndarray
+
+    @classmethod
+    def from_cells(cls, cells: List[StormCell]) -> "StormCellTable":
+        """Build a table from a list of storm cells.
+
+        Args:
+            cells: Storm cells
+
+        Returns:
+            Storm cell table
+        """
+        n = len(cells)
+        return cls(
+            cells=list(cells),
+            lats=np.fromiter((c.latitude for c in cells), dtype=np.float64, count=n),
+            lons=np.fromiter((c.longitude for c in cells), dtype=np.float64, count=n),
+            intensities=np.fromiter((c.intensity for c in cells), dtype=np.int32, count=n),
+            movement_directions=np.fromiter((c.movement_direction for c in cells), dtype=np.int32, count=n),
+            movement_speeds=np.fromiter((c.movement_speed for c in cells), dtype=np.float64, count=n),
+        )
+
+    def row(self, i: int) -> StormCell:
+        """Get the storm cell at index i."""
+        return self.cells[i]
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __iter__(self) -> Iterator[StormCell]:
+        return iter(self.cells)
+
+    def __getitem__(self, i: int) -> StormCell:
+        return self.cells[i]
+
+
 class LightningStrike(BaseModel):
     """Lightning strike data."""
     latitude: float
@@ -96,6 +155,9 @@ class LightningStrike(BaseModel):
     strength: Optional[float] = None
     type: Optional[str] = None  # CG, IC, etc.
 
+    # Display-ready age string, filled in when the strike is picked for display
+    _age_str: str = ""
+
 
 class AtmosphericData(BaseModel):
     """Atmospheric parameters for severe weather."""
@@ -108,6 +170,9 @@ class AtmosphericData(BaseModel):
     total_totals: Optional[float] = None
     timestamp: datetime
 
+    # Analysis time as epoch seconds, filled in at ingest time
+    _epoch: int = 0
+
 
 class ForecastPeriod(BaseModel):
     """Forecast for a specific period."""
@@ -158,6 +223,12 @@ class RadarData(BaseModel):
     range: int  # nautical miles
     data: List[List[Optional[int]]]  # 2D array of values
 
+    # int8 dBZ grid (utils.quantize_reflectivity), rendered radar display
+    # (rich Text) and formatted scan time, filled in at ingest time
+    _grid: Optional[Any] = None
+    _ascii: Optional[Any] = None
+    _time_str: str = ""
+
 
 class StormReport(BaseModel):
     """Storm report (tornado, hail, wind)."""
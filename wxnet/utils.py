@@ -1,11 +1,29 @@
 """Utility functions for WXNET."""
 
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
+import time
 from datetime import datetime
-from rich.text import Text
+from functools import lru_cache
+from math import radians, degrees, sin, cos, sqrt, asin, atan2
+import numpy as np
+from rich.text import Span, Text
 from rich.style import Style
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
 
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@lru_cache(maxsize=512)
 def format_temperature(temp: float) -> str:
     """Format temperature with color.
 
@@ -18,6 +36,11 @@ def format_temperature(temp: float) -> str:
     return f"{temp:.0f}°F"
 
 
+_COMPASS_POINTS = ("N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
+                   "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW")
+_COMPASS_ARRAY = np.array(_COMPASS_POINTS)
+
+
 def format_wind(speed: float, direction: int, gust: Optional[float] = None) -> str:
     """Format wind information.
 
@@ -29,19 +52,50 @@ def format_wind(speed: float, direction: int, gust: Optional[float] = None) -> s
     Returns:
         Formatted wind string
     """
-    # Convert degrees to cardinal direction
-    directions = ["N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
-                  "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"]
-    idx = int((direction + 11.25) / 22.5) % 16
-    cardinal = directions[idx]
-
-    wind_str = f"{cardinal} {speed:.0f} mph"
+    wind_str = f"{format_bearing(direction)} {speed:.0f} mph"
     if gust and gust > speed + 5:
         wind_str += f" G{gust:.0f}"
 
     return wind_str
 
 
+def format_wind_vec(
+    speeds: np.ndarray,
+    directions: np.ndarray,
+    gusts: Optional[np.ndarray] = None
+) -> List[str]:
+    """Format wind information for many observations at once.
+
+    Element-wise equivalent of format_wind; missing gusts may be NaN. Values
+    are rounded to whole mph as arrays, leaving only integer formatting per
+    observation.
+
+    Args:
+        speeds: Wind speeds in mph
+        directions: Wind directions in degrees
+        gusts: Wind gusts in mph (optional)
+
+    Returns:
+        Formatted wind string for each observation
+    """
+    speeds = np.asarray(speeds, dtype=np.float64)
+    idx = ((np.asarray(directions) + 11.25) / 22.5).astype(np.int64) % 16
+    points = _COMPASS_ARRAY[idx].tolist()
+    # np.rint rounds half to even, as "%.0f" does
+    mph = np.rint(speeds).astype(np.int64).tolist()
+    if gusts is None:
+        return [f"{point} {speed} mph" for point, speed in zip(points, mph)]
+
+    # Gusts worth showing, or -1 where format_wind would leave them out
+    gusts = np.asarray(gusts, dtype=np.float64)
+    shown = np.where(gusts > speeds + 5, np.rint(np.nan_to_num(gusts)), -1).astype(np.int64).tolist()
+    return [
+        f"{point} {speed} mph G{gust}" if gust >= 0 else f"{point} {speed} mph"
+        for point, speed, gust in zip(points, mph, shown)
+    ]
+
+
+@lru_cache(maxsize=512)
 def format_pressure(pressure: float, trend: Optional[str] = None) -> str:
     """Format barometric pressure.
 
@@ -63,6 +117,28 @@ def format_pressure(pressure: float, trend: Optional[str] = None) -> str:
     return pressure_str
 
 
+# Alert severity colors
+_ALERT_COLORS = {
+    "Extreme": "bright_red",
+    "Severe": "red",
+    "Moderate": "yellow",
+    "Minor": "blue",
+    "Unknown": "white"
+}
+
+# Alert event symbols: the first keyword found in the event name wins
+# ("Flood" also covers "Flash Flood")
+_ALERT_SYMBOLS = (
+    ("Tornado", "🌪"),
+    ("Thunderstorm", "⛈"),
+    ("Flood", "🌊"),
+    ("Wind", "💨"),
+    ("Snow", "❄"),
+    ("Winter", "❄"),
+    ("Heat", "🔥"),
+)
+
+
 def get_alert_color(severity: str) -> str:
     """Get color for alert severity.
 
@@ -72,16 +148,10 @@ def get_alert_color(severity: str) -> str:
     Returns:
         Color name
     """
-    colors = {
-        "Extreme": "bright_red",
-        "Severe": "red",
-        "Moderate": "yellow",
-        "Minor": "blue",
-        "Unknown": "white"
-    }
-    return colors.get(severity, "white")
+    return _ALERT_COLORS.get(severity, "white")
 
 
+@lru_cache(maxsize=None)
 def get_alert_symbol(event: str) -> str:
     """Get symbol for alert type.
 
@@ -91,20 +161,27 @@ def get_alert_symbol(event: str) -> str:
     Returns:
         Symbol character
     """
-    if "Tornado" in event:
-        return "🌪"
-    elif "Thunderstorm" in event:
-        return "⛈"
-    elif "Flood" in event or "Flash Flood" in event:
-        return "🌊"
-    elif "Wind" in event:
-        return "💨"
-    elif "Snow" in event or "Winter" in event:
-        return "❄"
-    elif "Heat" in event:
-        return "🔥"
-    else:
-        return "⚠"
+    for keyword, symbol in _ALERT_SYMBOLS:
+        if keyword in event:
+            return symbol
+    return "⚠"
+
+
+@lru_cache(maxsize=None)
+def get_alert_style(severity: str, event: str) -> Tuple[str, str]:
+    """Get color and symbol for an alert.
+
+    Severities and event names are a small fixed vocabulary, so results are
+    cached for the life of the process.
+
+    Args:
+        severity: Alert severity level
+        event: Alert event type
+
+    Returns:
+        Tuple of (color name, symbol character)
+    """
+    return get_alert_color(severity), get_alert_symbol(event)
 
 
 def format_distance(miles: float) -> str:
@@ -131,10 +208,199 @@ def format_bearing(degrees: int) -> str:
     Returns:
         Cardinal direction
     """
-    directions = ["N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
-                  "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"]
     idx = int((degrees + 11.25) / 22.5) % 16
-    return directions[idx]
+    return _COMPASS_POINTS[idx]
+
+
+def format_bearing_batch(degrees: np.ndarray) -> List[str]:
+    """Format many bearings to cardinal directions at once.
+
+    Element-wise equivalent of format_bearing.
+
+    Args:
+        degrees: Bearings in degrees
+
+    Returns:
+        Cardinal direction for each bearing
+    """
+    idx = ((np.asarray(degrees) + 11.25) / 22.5).astype(np.int64) % 16
+    return _COMPASS_ARRAY[idx].tolist()
+
+
+@njit(cache=True, fastmath=True)
+def _gc_dist_rad(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in miles between two points given in radians."""
+    R = 3959.0  # Earth radius in miles
+
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+
+    a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
+    # a is in [0, 1], so asin(sqrt(a)) equals atan2(sqrt(a), sqrt(1 - a));
+    # the clamp guards rounding just past 1 for near-antipodal points
+    c = 2 * asin(sqrt(min(a, 1.0)))
+
+    return R * c
+
+
+@njit(cache=True, fastmath=True)
+def _bearing_rad(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Initial bearing in degrees [0, 360) between two points given in radians."""
+    dlon = lon2 - lon1
+
+    y = sin(dlon) * cos(lat2)
+    x = cos(lat1) * sin(lat2) - sin(lat1) * cos(lat2) * cos(dlon)
+
+    return (degrees(atan2(y, x)) + 360) % 360
+
+
+@njit(cache=True, fastmath=True)
+def _gc_dist_bearing_rad(lat1: float, lon1: float, lat2: float, lon2: float) -> Tuple[float, float]:
+    """Distance in miles and bearing in degrees between two points given in radians.
+
+    Fuses _gc_dist_rad and _bearing_rad: both cosines are shared, and the
+    bearing's sin/cos of dlon come from the haversine's half-angle terms.
+    """
+    cos_lat1 = cos(lat1)
+    cos_lat2 = cos(lat2)
+    sin_half_dlat = sin((lat2 - lat1) / 2)
+    sin_half_dlon = sin((lon2 - lon1) / 2)
+    cos_half_dlon = cos((lon2 - lon1) / 2)
+
+    a = sin_half_dlat ** 2 + cos_lat1 * cos_lat2 * sin_half_dlon ** 2
+    dist = 3959.0 * 2 * asin(sqrt(min(a, 1.0)))
+
+    sin_dlon = 2 * sin_half_dlon * cos_half_dlon
+    cos_dlon = 1 - 2 * sin_half_dlon ** 2
+    y = sin_dlon * cos_lat2
+    x = cos_lat1 * sin(lat2) - sin(lat1) * cos_lat2 * cos_dlon
+
+    return dist, (degrees(atan2(y, x)) + 360) % 360
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def haversine_batch(
+    lat0: float,
+    lon0: float,
+    lats: np.ndarray,
+    lons: np.ndarray,
+    out_d: np.ndarray,
+    out_b: np.ndarray
+) -> None:
+    """Calculate distance and bearing from one point to many points.
+
+    Args:
+        lat0: Latitude of origin point
+        lon0: Longitude of origin point
+        lats: Latitudes of target points (float64 array)
+        lons: Longitudes of target points (float64 array)
+        out_d: Output array for distances in miles
+        out_b: Output array for bearings in degrees
+    """
+    lat0_rad = radians(lat0)
+    lon0_rad = radians(lon0)
+
+    for i in prange(lats.shape[0]):
+        lat_rad = radians(lats[i])
+        lon_rad = radians(lons[i])
+        out_d[i], out_b[i] = _gc_dist_bearing_rad(lat0_rad, lon0_rad, lat_rad, lon_rad)
+
+
+def _distance_bearing_numpy(
+    lat0: float,
+    lon0: float,
+    lats: np.ndarray,
+    lons: np.ndarray,
+    out_d: np.ndarray,
+    out_b: np.ndarray
+) -> None:
+    """NumPy version of haversine_batch, used when numba is not installed.
+
+    Same fused trig as _gc_dist_bearing_rad, evaluated over whole arrays
+    instead of one point per Python loop iteration.
+    """
+    lat1 = radians(lat0)
+    lat2 = np.radians(lats)
+    half_dlat = (lat2 - lat1) / 2
+    half_dlon = np.radians(lons - lon0) / 2
+
+    cos_lat2 = np.cos(lat2)
+    sin_half_dlon = np.sin(half_dlon)
+
+    a = np.sin(half_dlat) ** 2 + cos(lat1) * cos_lat2 * sin_half_dlon ** 2
+    out_d[:] = 3959.0 * 2 * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+    y = 2 * sin_half_dlon * np.cos(half_dlon) * cos_lat2
+    x = cos(lat1) * np.sin(lat2) - sin(lat1) * cos_lat2 * (1 - 2 * sin_half_dlon ** 2)
+    out_b[:] = (np.degrees(np.arctan2(y, x)) + 360) % 360
+
+
+_distance_bearing = haversine_batch if NUMBA_AVAILABLE else _distance_bearing_numpy
+
+
+@njit(cache=True, fastmath=True)
+def search_intercept(
+    chase_lat: float,
+    chase_lon: float,
+    storm_lat: float,
+    storm_lon: float,
+    storm_v_lat: float,
+    storm_v_lon: float,
+    chase_speed_mph: float,
+    step_minutes: float = 5.0,
+    horizon_minutes: float = 120.0
+) -> Tuple[float, float, float, float, float]:
+    """Find the quickest reachable intercept of a moving storm.
+
+    Tries intercept times from 0 to horizon_minutes every step_minutes and
+    keeps the one with the shortest chase time that still arrives before the
+    storm. The best candidate is carried through the loop rather than stored
+    per step, so a finer search costs time but no memory.
+
+    Args:
+        chase_lat: Latitude of the chase vehicle
+        chase_lon: Longitude of the chase vehicle
+        storm_lat: Current latitude of the storm
+        storm_lon: Current longitude of the storm
+        storm_v_lat: Storm velocity in degrees latitude per hour
+        storm_v_lon: Storm velocity in degrees longitude per hour
+        chase_speed_mph: Chase vehicle speed
+        step_minutes: Minutes between candidate intercept times
+        horizon_minutes: Latest candidate intercept time
+
+    Returns:
+        Tuple of (intercept time in minutes, intercept latitude, intercept
+        longitude, distance in miles, bearing in degrees); the time is -1
+        when no intercept is reachable
+    """
+    chase_lat_rad = radians(chase_lat)
+    chase_lon_rad = radians(chase_lon)
+
+    best_t = -1.0
+    best_lat = 0.0
+    best_lon = 0.0
+    best_dist = 0.0
+    best_hours = np.inf
+
+    for n in range(int(horizon_minutes // step_minutes) + 1):
+        t_minutes = n * step_minutes
+        t_hours = t_minutes / 60.0
+        lat = storm_lat + storm_v_lat * t_hours
+        lon = storm_lon + storm_v_lon * t_hours
+        dist = _gc_dist_rad(chase_lat_rad, chase_lon_rad, radians(lat), radians(lon))
+        chase_hours = dist / chase_speed_mph
+
+        if chase_hours <= t_hours and chase_hours < best_hours:
+            best_t = t_minutes
+            best_lat = lat
+            best_lon = lon
+            best_dist = dist
+            best_hours = chase_hours
+
+    bearing = 0.0
+    if best_t >= 0:
+        bearing = _bearing_rad(chase_lat_rad, chase_lon_rad, radians(best_lat), radians(best_lon))
+    return best_t, best_lat, best_lon, best_dist, bearing
 
 
 def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -149,22 +415,7 @@ def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     Returns:
         Distance in miles
     """
-    from math import radians, sin, cos, sqrt, atan2
-
-    R = 3959.0  # Earth radius in miles
-
-    lat1_rad = radians(lat1)
-    lon1_rad = radians(lon1)
-    lat2_rad = radians(lat2)
-    lon2_rad = radians(lon2)
-
-    dlat = lat2_rad - lat1_rad
-    dlon = lon2_rad - lon1_rad
-
-    a = sin(dlat / 2) ** 2 + cos(lat1_rad) * cos(lat2_rad) * sin(dlon / 2) ** 2
-    c = 2 * atan2(sqrt(a), sqrt(1 - a))
-
-    return R * c
+    return _gc_dist_rad(radians(lat1), radians(lon1), radians(lat2), radians(lon2))
 
 
 def calculate_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> int:
@@ -179,21 +430,132 @@ def calculate_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> int
     Returns:
         Bearing in degrees
     """
-    from math import radians, degrees, atan2, sin, cos
+    return int(_bearing_rad(radians(lat1), radians(lon1), radians(lat2), radians(lon2)))
+
+
+def calculate_distance_bearing_batch(
+    lat0: float,
+    lon0: float,
+    lats: np.ndarray,
+    lons: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculate distance and bearing from one point to many points.
+
+    Args:
+        lat0: Latitude of origin point
+        lon0: Longitude of origin point
+        lats: Latitudes of target points
+        lons: Longitudes of target points
+
+    Returns:
+        Tuple of (distances in miles, bearings in degrees) arrays
+    """
+    lats = np.ascontiguousarray(lats, dtype=np.float64)
+    lons = np.ascontiguousarray(lons, dtype=np.float64)
+    dists = np.empty(lats.shape[0])
+    bearings = np.empty(lats.shape[0])
+    _distance_bearing(lat0, lon0, lats, lons, dists, bearings)
+    return dists, bearings
+
 
-    lat1_rad = radians(lat1)
-    lat2_rad = radians(lat2)
-    dlon = radians(lon2 - lon1)
+# Radar reflectivity buckets: <15, 15-25, 25-35, 35-45, 45-55, 55-65, 65+ dBZ.
+# Glyphs and styles are indexed by bucket; the extra index is a row break.
+_RADAR_ROW_BREAK = 7
+_RADAR_GLYPHS = str.maketrans(
+    {i: glyph for i, glyph in enumerate(" .+#@██\n")}
+)
+_RADAR_STYLES = (None, "blue", "green", "yellow", "bright_yellow", "red", "bright_red", None)
 
-    y = sin(dlon) * cos(lat2_rad)
-    x = cos(lat1_rad) * sin(lat2_rad) - sin(lat1_rad) * cos(lat2_rad) * cos(dlon)
+# Quantized reflectivity: whole dBZ clipped to the range radars report, with
+# a sentinel for no return that sorts below every real value
+RADAR_NO_DATA = -128
+_DBZ_MIN = -30
+_DBZ_MAX = 95
 
-    bearing = degrees(atan2(y, x))
-    return int((bearing + 360) % 360)
+RadarGrid = Union[List[List[Optional[int]]], np.ndarray]
+
+
+def quantize_reflectivity(data: RadarGrid) -> np.ndarray:
+    """Quantize reflectivity to an int8 dBZ grid.
+
+    Args:
+        data: 2D reflectivity in dBZ, None or NaN where there is no return
+
+    Returns:
+        int8 array in whole dBZ, RADAR_NO_DATA where there is no return
+    """
+    grid = np.clip(np.asarray(data, dtype=np.float64), _DBZ_MIN, _DBZ_MAX)
+    return np.where(np.isnan(grid), RADAR_NO_DATA, grid).astype(np.int8)
+
+
+@njit(cache=True, nogil=True)
+def _render_radar_kernel(data: np.ndarray, out: np.ndarray, width: int, height: int) -> None:
+    """Downsample reflectivity to a bucket index grid.
+
+    Args:
+        data: 2D int8 reflectivity array from quantize_reflectivity
+        out: (height, width) uint8 output array of reflectivity buckets
+        width: Target width
+        height: Target height
+    """
+    y_scale = data.shape[0] / height
+    x_scale = data.shape[1] / width
+
+    for y in range(height):
+        data_y = int(y * y_scale)
+        for x in range(width):
+            value = data[data_y, int(x * x_scale)]
+
+            # RADAR_NO_DATA is below 15, so no return lands in the empty bucket
+            if value < 15:
+                out[y, x] = 0
+            elif value < 25:
+                out[y, x] = 1
+            elif value < 35:
+                out[y, x] = 2
+            elif value < 45:
+                out[y, x] = 3
+            elif value < 55:
+                out[y, x] = 4
+            elif value < 65:
+                out[y, x] = 5
+            else:
+                out[y, x] = 6
+
+
+# Lower dBZ edge of buckets 1-6
+_RADAR_BUCKET_EDGES = np.array([15, 25, 35, 45, 55, 65], dtype=np.int8)
+
+
+def _render_radar_numpy(data: np.ndarray, out: np.ndarray, width: int, height: int) -> None:
+    """NumPy version of _render_radar_kernel, used when numba is not installed.
+
+    Gathers the sampled cells with index arrays and buckets them with one
+    searchsorted, instead of running the kernel's loops as plain Python.
+    """
+    ys = (np.arange(height) * (data.shape[0] / height)).astype(np.intp)
+    xs = (np.arange(width) * (data.shape[1] / width)).astype(np.intp)
+    out[:] = np.searchsorted(_RADAR_BUCKET_EDGES, data[ys[:, None], xs], side="right")
+
+
+_render_radar = _render_radar_kernel if NUMBA_AVAILABLE else _render_radar_numpy
+
+
+def _radar_buckets(data: RadarGrid, width: int, height: int) -> np.ndarray:
+    """Downsample radar data to a (height, width) reflectivity bucket grid."""
+    if isinstance(data, np.ndarray) and data.dtype == np.int8:
+        grid = data
+    else:
+        # Only the sampled rows are needed, so quantize just those
+        y_scale = len(data) / height
+        grid = quantize_reflectivity([data[int(y * y_scale)] for y in range(height)])
+    buckets = np.empty((height, width), dtype=np.uint8)
+    _render_radar(grid, buckets, width, height)
+    return buckets
 
 
 def render_radar_ascii(
-    data: List[List[Optional[int]]],
+    data: RadarGrid,
     width: int,
     height: int,
     color: bool = True
@@ -201,7 +563,7 @@ def render_radar_ascii(
     """Render radar data as ASCII art.
 
     Args:
-        data: 2D array of radar values
+        data: 2D array of radar values, or an int8 grid from quantize_reflectivity
         width: Target width
         height: Target height
         color: Use color coding
@@ -209,43 +571,55 @@ def render_radar_ascii(
     Returns:
         List of ASCII art lines
     """
-    if not data or not data[0]:
+    if len(data) == 0 or len(data[0]) == 0:
         return ["No radar data available"]
 
-    # Scale data to fit display
-    data_height = len(data)
-    data_width = len(data[0])
+    buckets = _radar_buckets(data, width, height)
+    text = buckets.tobytes().decode("ascii").translate(_RADAR_GLYPHS)
+    return [text[y * width:(y + 1) * width] for y in range(height)]
 
-    y_scale = data_height / height
-    x_scale = data_width / width
 
-    lines = []
+def render_radar_text(
+    data: RadarGrid,
+    width: int,
+    height: int
+) -> Text:
+    """Render radar data as ASCII art colored by reflectivity.
 
-    for y in range(height):
-        line = ""
-        for x in range(width):
-            # Sample from data
-            data_y = int(y * y_scale)
-            data_x = int(x * x_scale)
+    Colors follow get_reflectivity_color. Styles are applied per run of equal
+    buckets, so the cost scales with the number of runs, not cells.
 
-            value = data[data_y][data_x]
+    Args:
+        data: 2D array of radar values, or an int8 grid from quantize_reflectivity
+        width: Target width
+        height: Target height
 
-            if value is None or value < 15:
-                line += " "
-            elif value < 25:
-                line += "."
-            elif value < 35:
-                line += "+"
-            elif value < 45:
-                line += "#"
-            elif value < 55:
-                line += "@"
-            else:
-                line += "█"
+    Returns:
+        Styled radar text, one line per row
+    """
+    if len(data) == 0 or len(data[0]) == 0:
+        return Text("No radar data available")
+
+    # Append a row-break column so the flattened grid lines up with the text
+    buckets = np.empty((height, width + 1), dtype=np.uint8)
+    buckets[:, :width] = _radar_buckets(data, width, height)
+    buckets[:, width] = _RADAR_ROW_BREAK
+    flat = buckets.ravel()[:-1]
 
-        lines.append(line)
+    plain = flat.tobytes().decode("ascii").translate(_RADAR_GLYPHS)
 
-    return lines
+    # Split into runs of equal buckets and style each run once
+    bounds = np.flatnonzero(flat[1:] != flat[:-1]) + 1
+    starts = np.concatenate(([0], bounds)).tolist()
+    ends = np.concatenate((bounds, [flat.shape[0]])).tolist()
+    run_buckets = flat[starts].tolist()
+
+    spans = [
+        Span(start, end, _RADAR_STYLES[bucket])
+        for start, end, bucket in zip(starts, ends, run_buckets)
+        if _RADAR_STYLES[bucket]
+    ]
+    return Text(plain, spans=spans)
 
 
 def get_reflectivity_color(dbz: Optional[int]) -> str:
@@ -273,6 +647,27 @@ def get_reflectivity_color(dbz: Optional[int]) -> str:
         return "bright_red"
 
 
+_REFLECTIVITY_COLORS = np.array(
+    ["black", "blue", "green", "yellow", "bright_yellow", "red", "bright_red"]
+)
+
+
+def get_reflectivity_color_vec(dbz: np.ndarray) -> np.ndarray:
+    """Get colors for an array of reflectivity values.
+
+    Vectorized get_reflectivity_color; NaN is treated like None.
+
+    Args:
+        dbz: Reflectivity values in dBZ
+
+    Returns:
+        Array of color names, same shape as dbz
+    """
+    dbz = np.asarray(dbz, dtype=np.float64)
+    idx = np.digitize(np.where(np.isnan(dbz), -1.0, dbz), _RADAR_BUCKET_EDGES)
+    return _REFLECTIVITY_COLORS[idx]
+
+
 def format_time_ago(dt: datetime) -> str:
     """Format datetime as relative time.
 
@@ -285,8 +680,53 @@ def format_time_ago(dt: datetime) -> str:
     now = datetime.now(dt.tzinfo) if dt.tzinfo else datetime.now()
     diff = now - dt
 
-    seconds = diff.total_seconds()
+    return _format_age(int(diff.total_seconds()))
+
+
+def format_time_ago_epoch(ts: int, now: Optional[int] = None) -> str:
+    """Format epoch seconds as relative time.
+
+    Cheaper than format_time_ago for timestamps converted once at ingest.
+
+    Args:
+        ts: Epoch seconds to format
+        now: Current epoch seconds, to share one clock read across many calls
+
+    Returns:
+        Formatted relative time string
+    """
+    return _format_age((now or int(time.time())) - ts)
+
+
+def format_time_ago_vec(
+    times: np.ndarray,
+    now: Optional[np.datetime64] = None
+) -> List[str]:
+    """Format an array of timestamps as relative times.
+
+    Vectorized format_time_ago for naive UTC datetime64 values.
+
+    Args:
+        times: datetime64 timestamps to format
+        now: Current time, to share one clock read across many calls
+
+    Returns:
+        Formatted relative time strings, in input order
+    """
+    if now is None:
+        now = np.datetime64(int(time.time()), "s")
+    seconds = (now - np.asarray(times)).astype("timedelta64[s]").astype(np.int64)
+
+    conditions = [seconds < 60, seconds < 3600, seconds < 86400]
+    values = np.select(conditions, [0, seconds // 60, seconds // 3600], seconds // 86400)
+    suffixes = np.select(conditions, ["", "m ago", "h ago"], "d ago")
+    labels = np.char.add(np.char.mod("%d", values), suffixes)
+    return np.where(seconds < 60, "just now", labels).tolist()
+
 
+@lru_cache(maxsize=4096)
+def _format_age(seconds: int) -> str:
+    """Format an age in whole seconds as relative time."""
     if seconds < 60:
         return "just now"
     elif seconds < 3600: